@@ -11,9 +11,12 @@ static bearer token is the simplest compatible option.
 
 from __future__ import annotations
 
+import hashlib
+import hmac
 import secrets
 import time
 from collections.abc import Sequence
+from functools import lru_cache
 
 from fastmcp.server.auth import AccessToken, TokenVerifier
 from mcp.server.auth.middleware.auth_context import AuthContextMiddleware
@@ -51,14 +54,20 @@ class BearerOrQueryAuthBackend(AuthenticationBackend):
         token: str | None = None
 
         auth_header = conn.headers.get("authorization")
-        if auth_header and auth_header.lower().startswith("bearer "):
+        # Only lowercase the scheme prefix, not the whole header value
+        if auth_header and auth_header[:7].lower() == "bearer ":
             token = auth_header[7:].strip()
 
         if not token and self._query_param_names:
-            query_params = conn.query_params
+            # One scan over the query string. Earlier names take priority and, as
+            # with QueryParams.get, the last duplicate of a name is the one used.
+            found = {
+                name: value
+                for name, value in conn.query_params.multi_items()
+                if name in self._query_param_names
+            }
             for name in self._query_param_names:
-                value = query_params.get(name)
-                if value:
+                if value := found.get(name):
                     token = value.strip()
                     break
 
@@ -95,32 +104,46 @@ class StaticBearerTokenAuth(TokenVerifier):
         required_scopes: list[str] | None = None,
     ):
         super().__init__(required_scopes=required_scopes)
-        self._tokens = tuple(t for t in (s.strip() for s in tokens) if t)
+        # Tokens are kept as bytes so compare_digest works on raw memory
+        self._tokens = tuple(t.encode() for t in (s.strip() for s in tokens) if t)
         if not self._tokens:
             raise ValueError("At least one non-empty token is required")
 
+        # Index tokens by a keyed digest so lookup is a single dict probe. The
+        # per-process random key keeps digests unpredictable to callers.
+        self._key = secrets.token_bytes(32)
+        self._digests = {self._digest(t): t for t in self._tokens}
+
         self._client_id = client_id
         self._allow_query_param_auth = allow_query_param_auth
         self._query_param_names = tuple(query_param_names)
+        self._middleware = self._build_middleware()
+
+    def _digest(self, token: bytes) -> bytes:
+        return hmac.new(self._key, token, hashlib.sha256).digest()
 
     async def verify_token(self, token: str) -> AccessToken | None:
         if not token:
             return None
 
-        for expected in self._tokens:
-            if secrets.compare_digest(token, expected):
-                return AccessToken(
-                    token=token,
-                    client_id=self._client_id,
-                    scopes=[],
-                    expires_at=None,
-                    resource=None,
-                    claims={"auth": "static_bearer"},
-                )
+        token_bytes = token.encode()
+        expected = self._digests.get(self._digest(token_bytes))
+        if expected is None or not secrets.compare_digest(token_bytes, expected):
+            return None
 
-        return None
+        return AccessToken(
+            token=token,
+            client_id=self._client_id,
+            scopes=[],
+            expires_at=None,
+            resource=None,
+            claims={"auth": "static_bearer"},
+        )
 
     def get_middleware(self) -> list:
+        return self._middleware
+
+    def _build_middleware(self) -> list:
         query_param_names = self._query_param_names if self._allow_query_param_auth else ()
         return [
             Middleware(
@@ -134,6 +157,7 @@ class StaticBearerTokenAuth(TokenVerifier):
         ]
 
 
+@lru_cache(maxsize=4)
 def build_auth_provider(mcp_auth_token: str | None) -> TokenVerifier | None:
     """Build an auth provider from env/config.
 
@@ -141,6 +165,8 @@ def build_auth_provider(mcp_auth_token: str | None) -> TokenVerifier | None:
 
     Supports token rotation via comma-separated tokens:
     - MCP_AUTH_TOKEN=tok1,tok2
+
+    Results are cached per raw token string, so repeated calls share one provider.
     """
 
     if not mcp_auth_token or not mcp_auth_token.strip():
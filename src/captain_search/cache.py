@@ -0,0 +1,138 @@
+"""In-process result caching for search-proxy."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable, Hashable
+from typing import Any, TypeVar
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+T = TypeVar("T")
+
+# Query parameters that only track clicks and never change the page
+_TRACKING_PARAMS = frozenset({"gclid", "fbclid", "msclkid", "dclid", "yclid"})
+_DEFAULT_PORTS = {"http": 80, "https": 443}
+
+
+def normalize_query(query: str) -> str:
+    """Normalize a query for cache keys: casefold and collapse whitespace."""
+    return " ".join(query.split()).casefold()
+
+
+def _is_tracking_param(name: str) -> bool:
+    return name.startswith("utm_") or name in _TRACKING_PARAMS
+
+
+def canonical_url(url: str) -> str:
+    """Normalize a URL for duplicate detection and cache keys.
+
+    Lowercases the scheme and host, drops default ports, fragments, trailing
+    slashes and tracking parameters. Only used as a key; callers keep and
+    request the original URL. URLs that can't be parsed are returned stripped
+    but otherwise unchanged.
+    """
+    url = url.strip()
+    try:
+        parts = urlsplit(url)
+    except ValueError:
+        return url  # e.g. an unbalanced IPv6 bracket from a provider
+    scheme = parts.scheme.lower()
+    netloc = parts.netloc.lower()
+    try:
+        if parts.port is not None and parts.port == _DEFAULT_PORTS.get(scheme):
+            netloc = netloc.rpartition(":")[0]
+    except ValueError:
+        pass  # Malformed port; keep the netloc as-is
+
+    query = parts.query
+    if query:
+        params = parse_qsl(query, keep_blank_values=True)
+        if any(_is_tracking_param(name) for name, _ in params):
+            query = urlencode([(k, v) for k, v in params if not _is_tracking_param(k)])
+
+    return urlunsplit((scheme, netloc, parts.path.rstrip("/"), query, ""))
+
+
+class TTLCache:
+    """A small LRU cache whose entries expire after a per-entry TTL.
+
+    Not thread-safe; intended for use from a single event loop.
+    """
+
+    def __init__(self, maxsize: int = 512):
+        self.maxsize = maxsize
+        self._entries: OrderedDict[Hashable, tuple[float, Any]] = OrderedDict()
+
+    def get(self, key: Hashable) -> Any | None:
+        """Return the cached value for key, or None if missing or expired."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return value
+
+    def set(self, key: Hashable, value: Any, ttl: float) -> None:
+        """Store value under key for ttl seconds. A non-positive ttl stores nothing."""
+        if ttl <= 0:
+            return
+        self._entries[key] = (time.monotonic() + ttl, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop all entries."""
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class SingleFlight:
+    """Coalesce concurrent calls that share a key into one in-flight call.
+
+    The first caller starts the work; callers arriving before it finishes await
+    the same task and get the same result or exception. The work is cancelled
+    once every caller waiting on it has been cancelled.
+    """
+
+    def __init__(self) -> None:
+        self._tasks: dict[Hashable, asyncio.Task[Any]] = {}
+        self._waiters: dict[asyncio.Task[Any], int] = {}
+
+    async def run(self, key: Hashable, func: Callable[[], Awaitable[T]]) -> T:
+        task = self._tasks.get(key)
+        if task is None or task.done():
+            task = asyncio.ensure_future(func())
+            self._tasks[key] = task
+            task.add_done_callback(lambda done: self._forget(key, done))
+        self._waiters[task] = self._waiters.get(task, 0) + 1
+        try:
+            # Shield so one caller's cancellation doesn't cancel the others
+            return await asyncio.shield(task)
+        finally:
+            self._release(key, task)
+
+    def _release(self, key: Hashable, task: asyncio.Task[Any]) -> None:
+        remaining = self._waiters[task] - 1
+        if remaining:
+            self._waiters[task] = remaining
+            return
+        del self._waiters[task]
+        if not task.done():
+            # Nobody is left to use the result; stop the upstream work too
+            if self._tasks.get(key) is task:
+                del self._tasks[key]
+            task.cancel()
+
+    def _forget(self, key: Hashable, task: asyncio.Task[Any]) -> None:
+        if self._tasks.get(key) is task:
+            del self._tasks[key]
+        if not task.cancelled():
+            task.exception()  # Mark retrieved even if every caller went away
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import os
+from functools import lru_cache
 from pathlib import Path
 
 import yaml
@@ -56,6 +58,30 @@ class Settings(BaseSettings):
     # Timeouts
     search_timeout_seconds: float = Field(default=30.0, alias="SEARCH_TIMEOUT_SECONDS")
 
+    # Caching
+    search_cache_ttl_seconds: float = Field(
+        default=300.0,
+        alias="SEARCH_CACHE_TTL_SECONDS",
+        description="How long identical provider searches are served from cache (0 disables).",
+    )
+    fetch_cache_ttl_seconds: float = Field(
+        default=300.0,
+        alias="FETCH_CACHE_TTL_SECONDS",
+        description="How long fetched pages are served from cache (0 disables).",
+    )
+
+    # Concurrent provider calls in multi-provider searches; shrinks toward the
+    # minimum when providers answer 429/503 and recovers as calls succeed
+    search_concurrency_min: int = Field(default=1, ge=1, alias="SEARCH_CONCURRENCY_MIN")
+    search_concurrency_max: int = Field(default=8, ge=1, alias="SEARCH_CONCURRENCY_MAX")
+
+    # Auto mode skips a provider after it rejects its credentials (401, or repeated 403s)
+    auth_cooldown_seconds: float = Field(
+        default=300.0,
+        alias="AUTH_COOLDOWN_SECONDS",
+        description="How long auto mode skips a provider after auth failures (0 disables).",
+    )
+
     # Server settings
     mcp_server_name: str = Field(default="search_mcp", alias="MCP_SERVER_NAME")
     mcp_server_port: int = Field(default=8000, alias="MCP_SERVER_PORT")
@@ -83,28 +109,62 @@ DEFAULT_WEIGHTS = {
 }
 
 
+# Config files picked up from the working directory, in priority order
+DEFAULT_CONFIG_FILES = ("config.yaml", "config.yml", "captain_search.yaml")
+
+
+def _find_default_config() -> str | None:
+    """Find the default config file in the working directory with a single scan."""
+    try:
+        with os.scandir(".") as entries:
+            found = {e.name for e in entries if e.name in DEFAULT_CONFIG_FILES and e.is_file()}
+    except OSError:
+        return None
+    return next((name for name in DEFAULT_CONFIG_FILES if name in found), None)
+
+
+@lru_cache(maxsize=1)
+def _load_settings() -> Settings:
+    """Load settings from the environment and `.env` once per process.
+
+    When there is no `.env` file, the dotenv source is skipped and settings are
+    read straight from the process environment.
+    """
+    if not Path(".env").is_file():
+        return Settings(_env_file=None)
+    return Settings()
+
+
+@lru_cache(maxsize=8)
+def _load_providers_file(path: str, mtime_ns: int) -> ProvidersConfig:
+    """Parse a YAML provider config, cached by resolved path and modification time."""
+    with open(path) as f:
+        data = yaml.safe_load(f) or {}
+    providers_data = data.get("providers", {})
+    return ProvidersConfig(**providers_data)
+
+
 class Config:
     """Main configuration class combining settings and provider config."""
 
     def __init__(self, config_path: str | Path | None = None):
-        self.settings = Settings()
+        self.settings = _load_settings()
         self.providers = self._load_providers_config(config_path)
         self._apply_env_keys()
+        # Provider config is fixed from here on, so resolve the hot lookups once
+        self._enabled = self._resolve_enabled_providers()
+        self._weights = {name: getattr(self.providers, name).weight for name in self._enabled}
 
     def _load_providers_config(self, config_path: str | Path | None) -> ProvidersConfig:
         """Load provider configuration from YAML file or use defaults."""
         if config_path is None:
-            # Try default locations
-            for path in ["config.yaml", "config.yml", "captain_search.yaml"]:
-                if Path(path).exists():
-                    config_path = path
-                    break
+            config_path = _find_default_config()
 
         if config_path and Path(config_path).exists():
-            with open(config_path) as f:
-                data = yaml.safe_load(f) or {}
-            providers_data = data.get("providers", {})
-            return ProvidersConfig(**providers_data)
+            path = Path(config_path).resolve()
+            cached = _load_providers_file(str(path), path.stat().st_mtime_ns)
+            # Env keys are applied in place, so hand out a copy of the cached model
+            return cached.model_copy(deep=True)
 
         return ProvidersConfig()
 
@@ -134,8 +194,8 @@ class Config:
         if self.settings.exa_api_key:
             self.providers.exa.api_key = self.settings.exa_api_key
 
-    def get_enabled_providers(self) -> list[str]:
-        """Get list of enabled providers with valid API keys."""
+    def _resolve_enabled_providers(self) -> tuple[str, ...]:
+        """Compute the enabled providers with valid API keys."""
         enabled = []
         for name in ["serper", "brave", "tavily", "perplexity", "exa"]:
             provider = getattr(self.providers, name)
@@ -144,15 +204,15 @@ class Config:
         # exa_mcp is special - works without API key via free MCP endpoint
         if self.providers.exa_mcp.enabled:
             enabled.append("exa_mcp")
-        return enabled
+        return tuple(enabled)
+
+    def get_enabled_providers(self) -> list[str]:
+        """Get list of enabled providers with valid API keys."""
+        return list(self._enabled)
 
     def get_provider_weights(self) -> dict[str, int]:
         """Get weights for all enabled providers."""
-        weights = {}
-        for name in self.get_enabled_providers():
-            provider = getattr(self.providers, name)
-            weights[name] = provider.weight
-        return weights
+        return dict(self._weights)
 
 
 # Global config instance (lazy initialization)
@@ -171,3 +231,5 @@ def reset_config() -> None:
     """Reset the global config (useful for testing)."""
     global _config
     _config = None
+    _load_settings.cache_clear()
+    _load_providers_file.cache_clear()
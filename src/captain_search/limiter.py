@@ -0,0 +1,60 @@
+"""Adaptive concurrency limiting for upstream provider calls."""
+
+from __future__ import annotations
+
+import asyncio
+import weakref
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+
+
+class AdaptiveLimiter:
+    """Concurrency limit that adapts to upstream overload (AIMD).
+
+    Like TCP congestion control, the limit halves when a call reports overload
+    (e.g. HTTP 429) and grows by one after a full window of successful calls.
+    """
+
+    def __init__(self, min_limit: int = 1, max_limit: int = 8):
+        self.min_limit = max(1, min_limit)
+        self.max_limit = max(self.min_limit, max_limit)
+        self.limit = self.max_limit
+        self._active = 0
+        self._successes = 0
+        # Conditions are bound to an event loop, so keep one per loop
+        self._conditions: weakref.WeakKeyDictionary[
+            asyncio.AbstractEventLoop, asyncio.Condition
+        ] = weakref.WeakKeyDictionary()
+
+    def _condition(self) -> asyncio.Condition:
+        loop = asyncio.get_running_loop()
+        condition = self._conditions.get(loop)
+        if condition is None:
+            condition = self._conditions[loop] = asyncio.Condition()
+        return condition
+
+    @asynccontextmanager
+    async def slot(self) -> AsyncIterator[None]:
+        """Wait for a free slot under the current limit and hold it."""
+        condition = self._condition()
+        async with condition:
+            await condition.wait_for(lambda: self._active < self.limit)
+            self._active += 1
+        try:
+            yield
+        finally:
+            async with condition:
+                self._active -= 1
+                condition.notify_all()
+
+    def record(self, overloaded: bool) -> None:
+        """Feed back the outcome of a call made while holding a slot."""
+        if overloaded:
+            self.limit = max(self.min_limit, self.limit // 2)
+            self._successes = 0
+            return
+
+        self._successes += 1
+        if self._successes >= self.limit:
+            self.limit = min(self.max_limit, self.limit + 1)
+            self._successes = 0
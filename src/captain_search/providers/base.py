@@ -2,11 +2,131 @@
 
 from __future__ import annotations
 
+import asyncio
+import itertools
+import weakref
 from abc import ABC, abstractmethod
+from collections.abc import AsyncIterator, Iterable, Iterator
+from functools import lru_cache
 from typing import Any
+from urllib.parse import urlsplit
 
 import httpx
-from pydantic import BaseModel, ConfigDict, Field
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter, ValidationError
+
+HTTP_LIMITS = httpx.Limits(
+    max_connections=200,
+    max_keepalive_connections=100,
+    keepalive_expiry=60.0,
+)
+
+# Connection failures are retried in the transport before a provider call fails.
+# httpx only retries errors raised while connecting, so this is safe for POSTs.
+HTTP_CONNECT_RETRIES = 2
+CONNECT_TIMEOUT = 5.0
+
+# One pooled HTTP/2 client per event loop, shared by every provider instance.
+# httpx clients are bound to the loop they first run on, hence the keying.
+_SHARED_CLIENTS: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, httpx.AsyncClient] = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def get_shared_client() -> httpx.AsyncClient:
+    """Get the pooled HTTP client for the running event loop."""
+    loop = asyncio.get_running_loop()
+    client = _SHARED_CLIENTS.get(loop)
+    if client is None or client.is_closed:
+        transport = httpx.AsyncHTTPTransport(
+            http2=True, limits=HTTP_LIMITS, retries=HTTP_CONNECT_RETRIES
+        )
+        client = httpx.AsyncClient(transport=transport)
+        _SHARED_CLIENTS[loop] = client
+    return client
+
+
+async def close_shared_client() -> None:
+    """Close the pooled HTTP client for the running event loop, if any."""
+    client = _SHARED_CLIENTS.pop(asyncio.get_running_loop(), None)
+    if client is not None and not client.is_closed:
+        await client.aclose()
+
+
+async def prewarm_connections(urls: Iterable[str], timeout: float = 5.0) -> None:
+    """Open pooled connections to provider hosts ahead of the first request.
+
+    Sends a HEAD to each distinct origin through the shared client so DNS, TCP
+    and TLS setup happen at server boot instead of on the first search. The
+    response status doesn't matter and failures are ignored.
+    """
+    client = get_shared_client()
+    origins = {
+        f"{parts.scheme}://{parts.netloc}/"
+        for parts in map(urlsplit, urls)
+        if parts.scheme and parts.netloc
+    }
+    await asyncio.gather(
+        *(client.head(origin, timeout=timeout) for origin in origins),
+        return_exceptions=True,
+    )
+
+
+@lru_cache(maxsize=16)
+def request_timeout(timeout: float) -> httpx.Timeout:
+    """Get the per-request timeout for a provider's overall timeout.
+
+    Connecting gets a shorter budget so an unreachable host fails fast (after
+    transport retries) instead of consuming the whole provider timeout.
+    """
+    return httpx.Timeout(timeout, connect=min(timeout, CONNECT_TIMEOUT))
+
+
+@lru_cache(maxsize=32)
+def key_cycle(keys: tuple[str, ...]) -> Iterator[str]:
+    """Get the shared round-robin iterator for a set of API keys.
+
+    Providers are created per request, so the rotation position is kept here
+    rather than on the instance.
+    """
+    return itertools.cycle(keys)
+
+
+_SSE_DATA_PREFIX = b"data:"
+
+
+async def iter_sse_data(response: httpx.Response) -> AsyncIterator[bytes]:
+    """Yield the raw payload of each `data:` line of a streamed SSE response.
+
+    Lines are split on bytes so payloads can go straight to a bytes JSON parser
+    without decoding the body to text first. Each payload is copied out of the
+    read buffer once, through a memoryview, rather than slicing the line twice.
+    """
+    buffer = bytearray()
+    async for chunk in response.aiter_bytes():
+        scan_from = len(buffer)
+        buffer += chunk
+        start = 0
+        while (end := buffer.find(b"\n", scan_from)) != -1:
+            if buffer.startswith(_SSE_DATA_PREFIX, start, end):
+                yield _sse_payload(buffer, start, end)
+            start = scan_from = end + 1
+        del buffer[:start]
+    if buffer.startswith(_SSE_DATA_PREFIX):
+        yield _sse_payload(buffer, 0, len(buffer))
+
+
+def _sse_payload(buffer: bytearray, start: int, end: int) -> bytes:
+    """Copy the payload of the `data:` line at buffer[start:end], minus any CR.
+
+    Per the SSE spec, a single space after the colon is not part of the payload.
+    """
+    if end > start and buffer[end - 1] == 0x0D:
+        end -= 1
+    start += len(_SSE_DATA_PREFIX)
+    if start < end and buffer[start] == 0x20:
+        start += 1
+    with memoryview(buffer) as view:
+        return view[start:end].tobytes()
 
 
 class SearchResult(BaseModel):
@@ -20,6 +140,10 @@ class SearchResult(BaseModel):
     source: str = Field(description="Provider that returned this result")
 
 
+# Validates a whole batch of normalized rows in one pydantic-core call
+_RESULTS_ADAPTER = TypeAdapter(list[SearchResult])
+
+
 class SearchResponse(BaseModel):
     """Response from a search operation."""
 
@@ -53,19 +177,23 @@ class SearchProvider(ABC):
     def __init__(self, api_key: str | None = None, timeout: float = 30.0):
         self.api_key = api_key
         self.timeout = timeout
-        self._client: httpx.AsyncClient | None = None
+        self.request_timeout = request_timeout(timeout)
 
     async def get_client(self) -> httpx.AsyncClient:
-        """Get or create an HTTP client."""
-        if self._client is None or self._client.is_closed:
-            self._client = httpx.AsyncClient(timeout=httpx.Timeout(self.timeout))
-        return self._client
+        """Get the shared HTTP client.
+
+        The client is pooled across providers, so pass
+        `timeout=self.request_timeout` on each request.
+        """
+        return get_shared_client()
 
     async def close(self) -> None:
-        """Close the HTTP client."""
-        if self._client and not self._client.is_closed:
-            await self._client.aclose()
-            self._client = None
+        """Release provider resources.
+
+        The shared HTTP client outlives individual providers and is closed by
+        `close_shared_client()` on server shutdown.
+        """
+        return None
 
     @abstractmethod
     async def search(self, query: str, max_results: int = 10) -> list[SearchResult]:
@@ -87,17 +215,34 @@ class SearchProvider(ABC):
 
     def _normalize_results(self, raw_results: list[dict[str, Any]]) -> list[SearchResult]:
         """Convert raw API results to SearchResult objects."""
-        results = []
-        for item in raw_results:
-            try:
-                result = SearchResult(
-                    title=item.get("title", ""),
-                    url=item.get("url") or item.get("link", ""),
-                    content=item.get("content") or item.get("snippet", ""),
-                    source=self.name,
-                )
-                if result.url:  # Only include results with valid URLs
-                    results.append(result)
-            except Exception:
-                continue  # Skip malformed results
-        return results
+        rows = [
+            {
+                "title": item.get("title") or "",
+                "url": url,
+                "content": item.get("content") or item.get("snippet") or "",
+                "source": self.name,
+            }
+            for item in raw_results
+            # Skip malformed rows and results without URLs
+            if isinstance(item, dict) and (url := item.get("url") or item.get("link"))
+        ]
+        return self._validate_rows(rows)
+
+    @staticmethod
+    def _validate_rows(rows: list[dict[str, Any]]) -> list[SearchResult]:
+        """Build SearchResult objects from field dicts, validating the batch at once.
+
+        Providers map their raw rows to `title`/`url`/`content`/`source` dicts
+        and pass them here. Rows that fail validation are skipped.
+        """
+        try:
+            return _RESULTS_ADAPTER.validate_python(rows)
+        except ValidationError:
+            # Fall back to per-row validation so one malformed result is skipped
+            results = []
+            for row in rows:
+                try:
+                    results.append(SearchResult(**row))
+                except ValidationError:
+                    continue
+            return results
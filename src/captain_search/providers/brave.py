@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import orjson
+
 from captain_search.providers.base import SearchProvider, SearchResult
 
 BRAVE_API_URL = "https://api.search.brave.com/res/v1/web/search"
@@ -12,6 +14,13 @@ class BraveProvider(SearchProvider):
 
     name = "brave"
 
+    def __init__(self, api_key: str | None = None, timeout: float = 30.0):
+        super().__init__(api_key=api_key, timeout=timeout)
+        self._headers = {
+            "X-Subscription-Token": api_key or "",
+            "Accept": "application/json",
+        }
+
     async def search(self, query: str, max_results: int = 10) -> list[SearchResult]:
         """
         Search using Brave Search API.
@@ -24,20 +33,17 @@ class BraveProvider(SearchProvider):
 
         client = await self.get_client()
 
-        headers = {
-            "X-Subscription-Token": self.api_key,
-            "Accept": "application/json",
-        }
-
         params = {
             "q": query,
             "count": max_results,
         }
 
-        response = await client.get(BRAVE_API_URL, headers=headers, params=params)
+        response = await client.get(
+            BRAVE_API_URL, headers=self._headers, params=params, timeout=self.request_timeout
+        )
         response.raise_for_status()
 
-        data = response.json()
+        data = orjson.loads(response.content)
 
         # Brave returns results in "web.results" path
         web_data = data.get("web", {})
@@ -47,17 +53,16 @@ class BraveProvider(SearchProvider):
 
     def _normalize_results(self, raw_results: list[dict]) -> list[SearchResult]:
         """Normalize Brave results to standard format."""
-        results = []
-        for item in raw_results:
-            try:
-                result = SearchResult(
-                    title=item.get("title", ""),
-                    url=item.get("url", ""),
-                    content=item.get("description", ""),
-                    source=self.name,
-                )
-                if result.url:
-                    results.append(result)
-            except Exception:
-                continue
-        return results
+        source = self.name
+        return self._validate_rows(
+            [
+                {
+                    "title": item.get("title", ""),
+                    "url": url,
+                    "content": item.get("description", ""),
+                    "source": source,
+                }
+                for item in raw_results
+                if isinstance(item, dict) and (url := item.get("url"))
+            ]
+        )
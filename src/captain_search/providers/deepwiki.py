@@ -2,12 +2,12 @@
 
 from __future__ import annotations
 
-import json
 import uuid
 
 import httpx
+import orjson
 
-from captain_search.providers.base import SearchProvider, SearchResult
+from captain_search.providers.base import SearchProvider, SearchResult, iter_sse_data
 
 DEEPWIKI_MCP_URL = "https://mcp.deepwiki.com/mcp"
 
@@ -37,6 +37,7 @@ class DeepWikiProvider(SearchProvider):
             DEEPWIKI_MCP_URL,
             json=payload,
             headers={"Accept": "application/json, text/event-stream"},
+            timeout=self.request_timeout,
         )
         response.raise_for_status()
 
@@ -55,37 +56,37 @@ class DeepWikiProvider(SearchProvider):
             "id": str(uuid.uuid4()),
         }
 
-        response = await client.post(
+        # Parse SSE events as they arrive rather than buffering the whole body
+        result: list[str] = []
+        async with client.stream(
+            "POST",
             DEEPWIKI_MCP_URL,
             json=payload,
             headers={
                 "Accept": "application/json, text/event-stream",
                 "Mcp-Session-Id": session_id,
             },
-        )
-        response.raise_for_status()
-
-        result: list[str] = []
-        for line in response.text.split("\n"):
-            if not line.startswith("data: "):
-                continue
-            data = line[6:]
-            if not data or data == "ping" or not data.startswith("{"):
-                continue
-            parsed = json.loads(data)
-            content = parsed.get("result", {}).get("content", [])
-            for item in content:
-                if item.get("type") == "text":
-                    result.append(item.get("text", ""))
+            timeout=self.request_timeout,
+        ) as response:
+            response.raise_for_status()
+            async for data in iter_sse_data(response):
+                if not data.startswith(b"{"):
+                    continue
+                parsed = orjson.loads(data)
+                content = parsed.get("result", {}).get("content", [])
+                for item in content:
+                    if item.get("type") == "text":
+                        result.append(item.get("text", ""))
         return "".join(result)
 
     async def ask_question(self, question: str, repo: str) -> str:
-        async with httpx.AsyncClient(timeout=self.timeout) as client:
-            session_id = await self._initialize_session(client)
-            return await self._call_tool(
-                client,
-                session_id,
-                "ask_question",
-                {"repoName": repo, "question": question},
-            )
+        # The MCP session is per call; only the pooled connection is shared
+        client = await self.get_client()
+        session_id = await self._initialize_session(client)
+        return await self._call_tool(
+            client,
+            session_id,
+            "ask_question",
+            {"repoName": repo, "question": question},
+        )
 
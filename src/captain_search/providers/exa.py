@@ -2,12 +2,18 @@
 
 from __future__ import annotations
 
-import random
+import orjson
 
-from captain_search.providers.base import SearchProvider, SearchResult
+from captain_search.providers.base import SearchProvider, SearchResult, key_cycle
 
 EXA_API_URL = "https://api.exa.ai/search"
 
+# Fixed-shape request body; only the query and result count vary per call
+_PAYLOAD_TEMPLATE = (
+    b'{"query":%b,"numResults":%d,"type":"auto","useAutoprompt":true,'
+    b'"contents":{"text":{"maxCharacters":500}}}'
+)
+
 
 class ExaProvider(SearchProvider):
     """Exa.ai Search provider using the official API.
@@ -36,11 +42,15 @@ class ExaProvider(SearchProvider):
         self.api_keys = api_keys or []
         if api_key and api_key not in self.api_keys:
             self.api_keys.append(api_key)
+        self._key_iter = key_cycle(tuple(self.api_keys)) if self.api_keys else None
+        self._headers_by_key = {
+            key: {"Content-Type": "application/json", "x-api-key": key} for key in self.api_keys
+        }
 
     def _get_api_key(self) -> str | None:
-        """Get an API key (random selection if multiple available)."""
-        if self.api_keys:
-            return random.choice(self.api_keys)
+        """Get an API key (round-robin if multiple available)."""
+        if self._key_iter:
+            return next(self._key_iter)
         return self.api_key
 
     async def search(self, query: str, max_results: int = 10) -> list[SearchResult]:
@@ -60,40 +70,31 @@ class ExaProvider(SearchProvider):
 
         client = await self.get_client()
 
-        headers = {
-            "Content-Type": "application/json",
-            "x-api-key": api_key,
-        }
-
-        payload = {
-            "query": query,
-            "numResults": max_results,
-            "type": "auto",
-            "useAutoprompt": True,
-            "contents": {
-                "text": {"maxCharacters": 500}
-            }
-        }
+        body = _PAYLOAD_TEMPLATE % (orjson.dumps(query), max_results)
 
-        response = await client.post(EXA_API_URL, json=payload, headers=headers)
+        response = await client.post(
+            EXA_API_URL,
+            content=body,
+            headers=self._headers_by_key[api_key],
+            timeout=self.request_timeout,
+        )
         response.raise_for_status()
 
-        data = response.json()
+        data = orjson.loads(response.content)
         return self._normalize_results(data.get("results", []))
 
     def _normalize_results(self, raw_results: list[dict]) -> list[SearchResult]:
         """Normalize raw Exa API results to standard format."""
-        results = []
-        for item in raw_results:
-            try:
-                result = SearchResult(
-                    title=item.get("title", ""),
-                    url=item.get("url", ""),
-                    content=item.get("text", item.get("snippet", ""))[:500],
-                    source=self.name,
-                )
-                if result.url:
-                    results.append(result)
-            except Exception:
-                continue
-        return results
+        source = self.name
+        return self._validate_rows(
+            [
+                {
+                    "title": item.get("title", ""),
+                    "url": url,
+                    "content": (item.get("text", item.get("snippet", "")) or "")[:500],
+                    "source": source,
+                }
+                for item in raw_results
+                if isinstance(item, dict) and (url := item.get("url"))
+            ]
+        )
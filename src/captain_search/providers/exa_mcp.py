@@ -2,12 +2,38 @@
 
 from __future__ import annotations
 
-import json
+import re
 
-from captain_search.providers.base import SearchProvider, SearchResult
+import httpx
+import orjson
+
+from captain_search.providers.base import SearchProvider, SearchResult, iter_sse_data
 
 EXA_MCP_URL = "https://mcp.exa.ai/mcp"
 
+_MCP_HEADERS = {
+    "Content-Type": "application/json",
+    "Accept": "application/json, text/event-stream",
+}
+
+# Field labels in Exa's web search text blocks, mapped to result keys
+_FIELD_KEYS = {"Title": "title", "URL": "url", "Text": "content"}
+_FIELD_PREFIXES = tuple(f"{label}:" for label in _FIELD_KEYS)
+
+# Code context responses separate sections with "## " headers
+_SECTION_RE = re.compile(r"\n## ")
+_URL_PREFIXES = ("https://", "http://")
+
+
+def _mcp_envelope(tool_name: str, arguments: dict) -> dict:
+    """Build an MCP JSON-RPC tools/call request."""
+    return {
+        "jsonrpc": "2.0",
+        "method": "tools/call",
+        "params": {"name": tool_name, "arguments": arguments},
+        "id": 1,
+    }
+
 
 class ExaMcpProvider(SearchProvider):
     """Exa.ai Search provider using the free MCP endpoint.
@@ -44,34 +70,11 @@ class ExaMcpProvider(SearchProvider):
         """
         client = await self.get_client()
 
-        # Build MCP JSON-RPC request
-        mcp_request = {
-            "jsonrpc": "2.0",
-            "method": "tools/call",
-            "params": {
-                "name": "web_search_exa",
-                "arguments": {
-                    "query": query,
-                    "numResults": max_results,
-                    "type": "auto",
-                }
-            },
-            "id": 1,
-        }
-
-        headers = {
-            "Content-Type": "application/json",
-            "Accept": "application/json, text/event-stream",
-        }
-
-        response = await client.post(EXA_MCP_URL, json=mcp_request, headers=headers)
-        response.raise_for_status()
-
-        # Parse SSE response - Exa returns "event: message\ndata: {...}"
-        text = response.text
-        results = self._parse_mcp_response(text)
-
-        return results
+        mcp_request = _mcp_envelope(
+            "web_search_exa",
+            {"query": query, "numResults": max_results, "type": "auto"},
+        )
+        return await self._stream_mcp_results(client, mcp_request)
 
     async def code_search(self, query: str, tokens_num: int = 5000) -> list[SearchResult]:
         """
@@ -86,49 +89,38 @@ class ExaMcpProvider(SearchProvider):
         """
         client = await self.get_client()
 
-        mcp_request = {
-            "jsonrpc": "2.0",
-            "method": "tools/call",
-            "params": {
-                "name": "get_code_context_exa",
-                "arguments": {
-                    "query": query,
-                    "tokensNum": tokens_num,
-                }
-            },
-            "id": 1,
-        }
-
-        headers = {
-            "Content-Type": "application/json",
-            "Accept": "application/json, text/event-stream",
-        }
-
-        response = await client.post(EXA_MCP_URL, json=mcp_request, headers=headers)
-        response.raise_for_status()
-
-        results = self._parse_mcp_response(response.text)
-        return results
+        mcp_request = _mcp_envelope(
+            "get_code_context_exa",
+            {"query": query, "tokensNum": tokens_num},
+        )
+        return await self._stream_mcp_results(client, mcp_request)
 
-    def _parse_mcp_response(self, text: str) -> list[SearchResult]:
-        """Parse the SSE response from Exa MCP endpoint."""
+    async def _stream_mcp_results(
+        self, client: httpx.AsyncClient, mcp_request: dict
+    ) -> list[SearchResult]:
+        """POST an MCP request and parse the SSE response as it streams in."""
         results = []
-        
-        # Find the JSON data in the SSE response
-        # Format is: "event: message\ndata: {...}"
-        for line in text.split("\n"):
-            if line.startswith("data: "):
-                json_str = line[6:]  # Remove "data: " prefix
+
+        # Exa responds with SSE events: "event: message\ndata: {...}"
+        async with client.stream(
+            "POST",
+            EXA_MCP_URL,
+            json=mcp_request,
+            headers=_MCP_HEADERS,
+            timeout=self.request_timeout,
+        ) as response:
+            response.raise_for_status()
+            async for payload in iter_sse_data(response):
                 try:
-                    data = json.loads(json_str)
-                    # Extract content from MCP response
-                    content = data.get("result", {}).get("content", [])
-                    for item in content:
-                        if item.get("type") == "text":
-                            text_content = item.get("text", "")
-                            results.extend(self._parse_search_results(text_content))
-                except json.JSONDecodeError:
+                    data = orjson.loads(payload)
+                except orjson.JSONDecodeError:
                     continue
+                # Extract content from MCP response
+                content = data.get("result", {}).get("content", [])
+                for item in content:
+                    if item.get("type") == "text":
+                        text_content = item.get("text", "")
+                        results.extend(self._parse_search_results(text_content))
 
         return results
 
@@ -143,47 +135,50 @@ class ExaMcpProvider(SearchProvider):
             return self._parse_code_context_results(text)
         
         # Standard web search format: Title:, URL:, Text: blocks
-        current_result = {}
-        lines = text.split("\n")
-        
-        for line in lines:
+        current_result: dict[str, str] = {}
+        content_lines: list[str] = []  # Joined once per result, not per line
+
+        for line in text.split("\n"):
             line = line.strip()
-            if line.startswith("Title:"):
-                # Save previous result if exists
-                if current_result.get("url"):
-                    results.append(SearchResult(
-                        title=current_result.get("title", ""),
-                        url=current_result.get("url", ""),
-                        content=current_result.get("content", "")[:500],  # Limit content
-                        source=self.name,
-                    ))
-                current_result = {"title": line[6:].strip()}
-            elif line.startswith("URL:"):
-                current_result["url"] = line[4:].strip()
-            elif line.startswith("Text:"):
-                current_result["content"] = line[5:].strip()
-            elif "content" in current_result and current_result.get("content"):
+            if line.startswith(_FIELD_PREFIXES):
+                label, _, value = line.partition(":")
+                key = _FIELD_KEYS[label]
+                value = value.strip()
+                if key == "title":
+                    # Save previous result if exists
+                    if current_result.get("url"):
+                        results.append(self._build_web_result(current_result, content_lines))
+                    current_result = {"title": value}
+                    content_lines = []
+                elif key == "content":
+                    content_lines = [value] if value else []
+                else:
+                    current_result[key] = value
+            elif content_lines:
                 # Append to content if we're in a text block
-                current_result["content"] += " " + line
+                content_lines.append(line)
 
         # Don't forget the last result
         if current_result.get("url"):
-            results.append(SearchResult(
-                title=current_result.get("title", ""),
-                url=current_result.get("url", ""),
-                content=current_result.get("content", "")[:500],
-                source=self.name,
-            ))
+            results.append(self._build_web_result(current_result, content_lines))
 
         return results
 
+    def _build_web_result(self, fields: dict[str, str], content_lines: list[str]) -> SearchResult:
+        """Build a web search result from parsed fields and buffered content lines."""
+        return SearchResult(
+            title=fields.get("title", ""),
+            url=fields["url"],
+            content=" ".join(content_lines)[:500],  # Limit content
+            source=self.name,
+        )
+
     def _parse_code_context_results(self, text: str) -> list[SearchResult]:
         """Parse code context results with ## headers and code blocks."""
-        import re
         results = []
         
         # Split by ## headers
-        sections = re.split(r'\n## ', text)
+        sections = _SECTION_RE.split(text)
         
         for section in sections:
             if not section.strip():
@@ -196,14 +191,19 @@ class ExaMcpProvider(SearchProvider):
             # First line is the title (may have leading ##)
             title = lines[0].lstrip("#").strip()
             
-            # Look for URL (usually on the next line, starts with http)
+            # The URL is normally the line right after the title
             url = ""
+            body = lines[1:]
+            if body and (candidate := body[0].strip()).startswith(_URL_PREFIXES):
+                url = candidate
+                body = body[1:]
             content_lines = []
             in_code_block = False
             
-            for line in lines[1:]:
+            for line in body:
                 stripped = line.strip()
-                if stripped.startswith("http"):
+                if not url and stripped.startswith(_URL_PREFIXES):
+                    # Fallback: take the first URL line if it wasn't right after the title
                     url = stripped
                 elif stripped == "```":
                     in_code_block = not in_code_block
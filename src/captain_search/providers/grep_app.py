@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-import httpx
+import orjson
 
 from captain_search.providers.base import SearchProvider, SearchResult
 
@@ -23,10 +23,10 @@ class GrepAppProvider(SearchProvider):
     async def code_search(
         self, query: str, repo: str | None = None, max_results: int = 10
     ) -> list[SearchResult]:
-        async with httpx.AsyncClient(timeout=self.timeout) as client:
-            response = await client.get(GREP_APP_URL, params={"q": query})
-            response.raise_for_status()
-            data = response.json()
+        client = await self.get_client()
+        response = await client.get(GREP_APP_URL, params={"q": query}, timeout=self.request_timeout)
+        response.raise_for_status()
+        data = orjson.loads(response.content)
 
         hits = data.get("hits", {}).get("hits", [])
         if repo:
@@ -2,9 +2,11 @@
 
 from __future__ import annotations
 
+import time
+
 import httpx
 
-from captain_search.providers.base import FetchResponse
+from captain_search.providers.base import FetchResponse, get_shared_client, request_timeout
 
 JINA_READER_URL = "https://r.jina.ai"
 
@@ -24,19 +26,18 @@ class JinaProvider:
         """
         self.api_key = api_key
         self.timeout = timeout
-        self._client: httpx.AsyncClient | None = None
+        self.request_timeout = request_timeout(timeout)
 
     async def get_client(self) -> httpx.AsyncClient:
-        """Get or create an HTTP client."""
-        if self._client is None or self._client.is_closed:
-            self._client = httpx.AsyncClient(timeout=httpx.Timeout(self.timeout))
-        return self._client
+        """Get the shared HTTP client (HTTP/2, pooled across providers)."""
+        return get_shared_client()
 
     async def close(self) -> None:
-        """Close the HTTP client."""
-        if self._client and not self._client.is_closed:
-            await self._client.aclose()
-            self._client = None
+        """Release provider resources.
+
+        The shared HTTP client is closed by `close_shared_client()` on server shutdown.
+        """
+        return None
 
     async def fetch(self, url: str, format: str = "markdown") -> FetchResponse:
         """
@@ -54,8 +55,6 @@ class JinaProvider:
         Returns:
             FetchResponse with extracted content
         """
-        import time
-
         start = time.monotonic()
 
         client = await self.get_client()
@@ -72,7 +71,9 @@ class JinaProvider:
             headers["Authorization"] = f"Bearer {self.api_key}"
 
         try:
-            response = await client.get(reader_url, headers=headers, follow_redirects=True)
+            response = await client.get(
+                reader_url, headers=headers, follow_redirects=True, timeout=self.request_timeout
+            )
             response.raise_for_status()
 
             content = response.text
@@ -81,7 +82,8 @@ class JinaProvider:
             # Try to extract title from markdown content
             title = ""
             if content.startswith("# "):
-                first_line = content.split("\n")[0]
+                newline = content.find("\n")
+                first_line = content[:newline] if newline != -1 else content
                 title = first_line.lstrip("# ").strip()
 
             return FetchResponse(
@@ -93,31 +95,23 @@ class JinaProvider:
             )
 
         except httpx.HTTPStatusError as e:
-            elapsed_ms = int((time.monotonic() - start) * 1000)
             error_msg = f"HTTP {e.response.status_code}"
             if e.response.status_code == 429:
                 error_msg = "Rate limit exceeded (20 RPM without API key)"
-            return FetchResponse(
-                url=url,
-                format=format,
-                elapsed_ms=elapsed_ms,
-                error=error_msg,
-            )
+            return self._error_response(url, format, start, error_msg)
 
         except httpx.TimeoutException:
-            elapsed_ms = int((time.monotonic() - start) * 1000)
-            return FetchResponse(
-                url=url,
-                format=format,
-                elapsed_ms=elapsed_ms,
-                error="Request timed out",
-            )
+            return self._error_response(url, format, start, "Request timed out")
 
         except Exception as e:
-            elapsed_ms = int((time.monotonic() - start) * 1000)
-            return FetchResponse(
-                url=url,
-                format=format,
-                elapsed_ms=elapsed_ms,
-                error=str(e),
-            )
+            return self._error_response(url, format, start, str(e))
+
+    @staticmethod
+    def _error_response(url: str, format: str, start: float, error: str) -> FetchResponse:
+        """Build a FetchResponse for a failed fetch."""
+        return FetchResponse(
+            url=url,
+            format=format,
+            elapsed_ms=int((time.monotonic() - start) * 1000),
+            error=error,
+        )
@@ -2,11 +2,12 @@
 
 from __future__ import annotations
 
-import json
+import asyncio
 import shutil
-import subprocess
 from pathlib import Path
 
+import orjson
+
 from captain_search.providers.base import SearchProvider, SearchResult
 
 NOODL_SEARCH_LIMIT = 10
@@ -36,7 +37,7 @@ class NoodlProvider(SearchProvider):
     async def search(self, query: str, max_results: int = 10) -> list[SearchResult]:
         return []
 
-    def code_search(
+    async def code_search(
         self,
         query: str,
         repo_path: Path,
@@ -46,30 +47,39 @@ class NoodlProvider(SearchProvider):
             return []
 
         repo_name = _repo_name_from_path(repo_path)
-        result = subprocess.run(
-            [
-                "noodl",
-                "search",
-                query,
-                repo_name,
-                "--limit",
-                str(max_results),
-                "--include-content",
-                "--format",
-                "json",
-            ],
+        process = await asyncio.create_subprocess_exec(
+            "noodl",
+            "search",
+            query,
+            repo_name,
+            "--limit",
+            str(max_results),
+            "--include-content",
+            "--format",
+            "json",
             cwd=repo_path,
-            capture_output=True,
-            text=True,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
         )
+        try:
+            stdout, _ = await asyncio.wait_for(process.communicate(), timeout=self.timeout)
+        except TimeoutError:
+            process.kill()
+            await process.wait()
+            return []
+        except asyncio.CancelledError:
+            # Don't leave noodl running behind a cancelled search
+            process.kill()
+            await process.wait()
+            raise
 
-        if result.returncode != 0:
+        if process.returncode != 0:
             return []
 
-        return self._parse_results(result.stdout)
+        return self._parse_results(stdout)
 
-    def _parse_results(self, output: str) -> list[SearchResult]:
-        data = json.loads(output)
+    def _parse_results(self, output: bytes) -> list[SearchResult]:
+        data = orjson.loads(output)
         results: list[SearchResult] = []
 
         for process in data.get("results", []):
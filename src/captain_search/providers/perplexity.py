@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import orjson
+
 from captain_search.providers.base import SearchProvider, SearchResult
 
 PERPLEXITY_API_URL = "https://api.perplexity.ai/search"
@@ -35,10 +37,12 @@ class PerplexityProvider(SearchProvider):
             "max_results": max_results,
         }
 
-        response = await client.post(PERPLEXITY_API_URL, headers=headers, json=payload)
+        response = await client.post(
+            PERPLEXITY_API_URL, headers=headers, json=payload, timeout=self.request_timeout
+        )
         response.raise_for_status()
 
-        data = response.json()
+        data = orjson.loads(response.content)
 
         # Perplexity returns results in "results" key
         raw_results = data.get("results", [])
@@ -47,17 +51,16 @@ class PerplexityProvider(SearchProvider):
 
     def _normalize_results(self, raw_results: list[dict]) -> list[SearchResult]:
         """Normalize Perplexity results to standard format."""
-        results = []
-        for item in raw_results:
-            try:
-                result = SearchResult(
-                    title=item.get("title", ""),
-                    url=item.get("url", ""),
-                    content=item.get("snippet") or item.get("content", ""),
-                    source=self.name,
-                )
-                if result.url:
-                    results.append(result)
-            except Exception:
-                continue
-        return results
+        source = self.name
+        return self._validate_rows(
+            [
+                {
+                    "title": item.get("title", ""),
+                    "url": url,
+                    "content": item.get("snippet") or item.get("content", ""),
+                    "source": source,
+                }
+                for item in raw_results
+                if isinstance(item, dict) and (url := item.get("url"))
+            ]
+        )
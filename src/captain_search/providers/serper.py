@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import orjson
+
 from captain_search.providers.base import SearchProvider, SearchResult
 
 SERPER_API_URL = "https://google.serper.dev/search"
@@ -34,10 +36,12 @@ class SerperProvider(SearchProvider):
             "num": max_results,
         }
 
-        response = await client.post(SERPER_API_URL, headers=headers, json=payload)
+        response = await client.post(
+            SERPER_API_URL, headers=headers, json=payload, timeout=self.request_timeout
+        )
         response.raise_for_status()
 
-        data = response.json()
+        data = orjson.loads(response.content)
 
         # Serper returns results in "organic" key
         raw_results = data.get("organic", [])
@@ -46,17 +50,16 @@ class SerperProvider(SearchProvider):
 
     def _normalize_results(self, raw_results: list[dict]) -> list[SearchResult]:
         """Normalize Serper results to standard format."""
-        results = []
-        for item in raw_results:
-            try:
-                result = SearchResult(
-                    title=item.get("title", ""),
-                    url=item.get("link", ""),
-                    content=item.get("snippet", ""),
-                    source=self.name,
-                )
-                if result.url:
-                    results.append(result)
-            except Exception:
-                continue
-        return results
+        source = self.name
+        return self._validate_rows(
+            [
+                {
+                    "title": item.get("title", ""),
+                    "url": url,
+                    "content": item.get("snippet", ""),
+                    "source": source,
+                }
+                for item in raw_results
+                if isinstance(item, dict) and (url := item.get("link"))
+            ]
+        )
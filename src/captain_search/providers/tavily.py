@@ -2,9 +2,9 @@
 
 from __future__ import annotations
 
-import random
+import orjson
 
-from captain_search.providers.base import SearchProvider, SearchResult
+from captain_search.providers.base import SearchProvider, SearchResult, key_cycle
 
 TAVILY_API_URL = "https://api.tavily.com/search"
 
@@ -24,14 +24,13 @@ class TavilyProvider(SearchProvider):
         self.api_keys = api_keys or []
         if api_key and api_key not in self.api_keys:
             self.api_keys.append(api_key)
+        self._key_iter = key_cycle(tuple(self.api_keys)) if self.api_keys else None
 
     def _get_api_key(self) -> str:
-        """Get an API key (random selection if multiple available)."""
-        if not self.api_keys:
-            if self.api_key:
-                return self.api_key
-            raise ValueError("Tavily API key is required")
-        return random.choice(self.api_keys)
+        """Get an API key (round-robin if multiple available)."""
+        if self._key_iter:
+            return next(self._key_iter)
+        raise ValueError("Tavily API key is required")
 
     async def search(self, query: str, max_results: int = 10) -> list[SearchResult]:
         """
@@ -51,10 +50,10 @@ class TavilyProvider(SearchProvider):
             "include_raw_content": False,
         }
 
-        response = await client.post(TAVILY_API_URL, json=payload)
+        response = await client.post(TAVILY_API_URL, json=payload, timeout=self.request_timeout)
         response.raise_for_status()
 
-        data = response.json()
+        data = orjson.loads(response.content)
 
         # Tavily returns results in "results" key
         raw_results = data.get("results", [])
@@ -63,17 +62,16 @@ class TavilyProvider(SearchProvider):
 
     def _normalize_results(self, raw_results: list[dict]) -> list[SearchResult]:
         """Normalize Tavily results to standard format."""
-        results = []
-        for item in raw_results:
-            try:
-                result = SearchResult(
-                    title=item.get("title", ""),
-                    url=item.get("url", ""),
-                    content=item.get("content", ""),
-                    source=self.name,
-                )
-                if result.url:
-                    results.append(result)
-            except Exception:
-                continue
-        return results
+        source = self.name
+        return self._validate_rows(
+            [
+                {
+                    "title": item.get("title", ""),
+                    "url": url,
+                    "content": item.get("content", ""),
+                    "source": source,
+                }
+                for item in raw_results
+                if isinstance(item, dict) and (url := item.get("url"))
+            ]
+        )
@@ -2,7 +2,9 @@
 
 from __future__ import annotations
 
+import asyncio
 import sys
+from contextlib import asynccontextmanager
 from typing import Annotated
 
 from fastmcp import FastMCP
@@ -10,8 +12,19 @@ from pydantic import Field
 
 from captain_search.auth import build_auth_provider
 from captain_search.config import get_config
+from captain_search.providers.base import close_shared_client, prewarm_connections
+from captain_search.providers.brave import BRAVE_API_URL
+from captain_search.providers.deepwiki import DEEPWIKI_MCP_URL
+from captain_search.providers.exa import EXA_API_URL
+from captain_search.providers.exa_mcp import EXA_MCP_URL
+from captain_search.providers.grep_app import GREP_APP_URL
+from captain_search.providers.jina import JINA_READER_URL
+from captain_search.providers.perplexity import PERPLEXITY_API_URL
+from captain_search.providers.serper import SERPER_API_URL
+from captain_search.providers.tavily import TAVILY_API_URL
 from captain_search.tools.code_search import search_code as code_impl
 from captain_search.tools.fetch import fetch_webpage as fetch_impl
+from captain_search.tools.search import resolve_providers
 from captain_search.tools.search import search_web as web_impl
 
 # Initialize config early to validate environment
@@ -20,6 +33,43 @@ config = get_config()
 # Optional auth for remote MCP deployments
 auth_provider = build_auth_provider(config.settings.mcp_auth_token)
 
+# Web search endpoints, warmed at startup only when the provider is enabled
+SEARCH_PROVIDER_URLS = {
+    "serper": SERPER_API_URL,
+    "brave": BRAVE_API_URL,
+    "tavily": TAVILY_API_URL,
+    "perplexity": PERPLEXITY_API_URL,
+    "exa": EXA_API_URL,
+    "exa_mcp": EXA_MCP_URL,
+}
+
+# Keyless endpoints used by search_code and fetch_webpage
+TOOL_URLS = (EXA_MCP_URL, GREP_APP_URL, DEEPWIKI_MCP_URL, JINA_READER_URL)
+
+
+def _prewarm_urls() -> list[str]:
+    """Get the upstream URLs worth connecting to at startup."""
+    enabled = config.get_enabled_providers()
+    urls = [SEARCH_PROVIDER_URLS[name] for name in enabled if name in SEARCH_PROVIDER_URLS]
+    urls.extend(TOOL_URLS)
+    return urls
+
+
+@asynccontextmanager
+async def lifespan(server: FastMCP):
+    """Warm provider connections on startup and close them on shutdown.
+
+    Connection setup to enabled providers moves from the first tool call to
+    server boot; warming runs in the background and never delays startup.
+    """
+    warm_task = asyncio.create_task(prewarm_connections(_prewarm_urls()))
+    try:
+        yield {}
+    finally:
+        warm_task.cancel()
+        await close_shared_client()
+
+
 # Create FastMCP server
 mcp = FastMCP(
     name="captain_search",
@@ -35,6 +85,7 @@ The server automatically selects providers based on configured weights and handl
 failures by trying alternative providers.
 """,
     auth=auth_provider,
+    lifespan=lifespan,
 )
 
 
@@ -84,6 +135,19 @@ async def search_web(
             )
         ),
     ] = None,
+    bypass_cache: Annotated[
+        bool,
+        Field(description="Skip cached results and query providers for fresh data."),
+    ] = False,
+    fast: Annotated[
+        bool,
+        Field(
+            description=(
+                "Multi-provider modes: return as soon as max_results unique results arrive "
+                "instead of waiting for every provider."
+            )
+        ),
+    ] = False,
 ) -> str:
     """
     Search the web using weighted selection or multi-provider search.
@@ -92,16 +156,19 @@ async def search_web(
         query: The search query string
         max_results: Maximum number of results (1-50, default 10). Per provider in multi mode.
         provider: Provider selector (default: auto)
+        bypass_cache: Skip cached results (default: False)
+        fast: Stop waiting once enough unique results arrive (default: False)
 
     Returns:
         Search results in markdown format
     """
-    provider_value = (provider or "auto").strip().lower()
     return await web_impl(
         query=query,
         max_results=max_results,
-        provider=provider_value,
+        provider=resolve_providers(provider),
         format="markdown",
+        bypass_cache=bypass_cache,
+        fast=fast,
     )
 
 
@@ -3,26 +3,38 @@
 from __future__ import annotations
 
 import asyncio
+import shutil
 import subprocess
+import tempfile
+from functools import lru_cache, partial
 from pathlib import Path
 from urllib.parse import urlparse
 
+from captain_search.cache import SingleFlight
 from captain_search.providers import DeepWikiProvider, ExaMcpProvider, GrepAppProvider, NoodlProvider
 from captain_search.providers.base import SearchResult
+from captain_search.tools.formatting import append_result_markdown
 
 EXA_CODE_TOKENS_NUM = 50000
 REPO_CACHE_DIR = Path.home() / ".cache" / "captain-search" / "repos"
 
+_LOCAL_PREFIXES = ("/", "./", "../", "~")
+_HTTP_PREFIXES = ("http://", "https://")
 
+# In-progress clones, keyed by owner/repo
+_CLONES = SingleFlight()
+
+
+@lru_cache(maxsize=256)
 def _parse_repo(repo: str) -> tuple[str, str]:
     repo = repo.strip()
-    if repo.startswith(("/", "./", "../", "~")):
+    if repo.startswith(_LOCAL_PREFIXES):
         raise ValueError("repo must be a git URL or owner/repo")
 
     if repo.startswith("git@"):
         host_part, path = repo.split(":", 1)
         host = host_part.split("@", 1)[1]
-    elif repo.startswith(("http://", "https://")):
+    elif repo.startswith(_HTTP_PREFIXES):
         parsed = urlparse(repo)
         host = parsed.netloc
         path = parsed.path
@@ -39,23 +51,51 @@ def _parse_repo(repo: str) -> tuple[str, str]:
     return full_name, clone_url
 
 
+@lru_cache(maxsize=256)
 def _get_cache_path(full_name: str) -> Path:
     safe_name = full_name.replace("/", "__")
     return REPO_CACHE_DIR / safe_name
 
 
-def _clone_repo(full_name: str, clone_url: str) -> Path:
+async def _clone_repo(full_name: str, clone_url: str) -> Path:
     cache_path = _get_cache_path(full_name)
     if cache_path.exists():
         return cache_path
+    # Concurrent searches of the same repo share one clone
+    return await _CLONES.run(full_name, partial(_clone_into_cache, clone_url, cache_path))
+
 
+async def _clone_into_cache(clone_url: str, cache_path: Path) -> Path:
+    """Clone into a private temp dir, then move it into place in one rename."""
     cache_path.parent.mkdir(parents=True, exist_ok=True)
-    subprocess.run(
-        ["git", "clone", "--depth", "1", clone_url, str(cache_path)],
-        check=True,
-        capture_output=True,
-        text=True,
-    )
+    tmp_path = Path(tempfile.mkdtemp(prefix=f".{cache_path.name}-", dir=cache_path.parent))
+    try:
+        cmd = ["git", "clone", "--depth", "1", clone_url, str(tmp_path)]
+        process = await asyncio.create_subprocess_exec(
+            *cmd,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+        )
+        try:
+            stdout, stderr = await process.communicate()
+        except asyncio.CancelledError:
+            # Don't leave git running behind a cancelled search
+            process.kill()
+            await process.wait()
+            raise
+        if process.returncode != 0:
+            raise subprocess.CalledProcessError(
+                process.returncode, cmd, output=stdout.decode(), stderr=stderr.decode()
+            )
+        try:
+            tmp_path.rename(cache_path)
+        except OSError:
+            # Another process finished its clone first; use that one
+            if not cache_path.exists():
+                raise
+    finally:
+        # Only ever remove our own temp dir, never the shared cache path
+        shutil.rmtree(tmp_path, ignore_errors=True)
     return cache_path
 
 
@@ -65,13 +105,7 @@ def _format_results_section(title: str, results: list[SearchResult]) -> str:
 
     lines = [f"## {title}"]
     for i, result in enumerate(results, 1):
-        lines.append(f"### {i}. {result.title}")
-        lines.append(f"**URL:** {result.url}")
-        if result.content:
-            content = result.content[:500] + "..." if len(result.content) > 500 else result.content
-            lines.append(f"\n{content}\n")
-        else:
-            lines.append("")
+        append_result_markdown(lines, f"### {i}. {result.title}", result)
     return "\n".join(lines).strip()
 
 
@@ -101,42 +135,60 @@ async def _grep_app_search(query: str, repo_full: str | None) -> list[SearchResu
         await provider.close()
 
 
-def _noodl_search(query: str, repo_path: Path) -> list[SearchResult]:
+async def _noodl_search(query: str, repo_path: Path) -> list[SearchResult]:
     provider = NoodlProvider()
     if not provider.is_available():
         return []
-    return provider.code_search(query, repo_path, max_results=10)
+    return await provider.code_search(query, repo_path, max_results=10)
+
+
+async def _repo_noodl_search(
+    query: str, repo_full: str, clone_url: str
+) -> list[SearchResult]:
+    repo_path = await _clone_repo(repo_full, clone_url)
+    return await _noodl_search(query, repo_path)
 
 
 async def search_code(query: str, repo: str | None = None) -> str:
     repo_full = None
-    repo_path = None
+    clone_url = None
     if repo:
         repo_full, clone_url = _parse_repo(repo)
-        repo_path = await asyncio.to_thread(_clone_repo, repo_full, clone_url)
+
+    # Backends are independent, so query them concurrently. The clone runs
+    # alongside the remote lookups and only gates Noodl, which needs a checkout.
+    searches = {
+        "exa": _exa_code_search(query, repo_full),
+        "grep": _grep_app_search(query, repo_full),
+    }
+    if repo_full and clone_url:
+        searches["deepwiki"] = _deepwiki_search(query, repo_full)
+        searches["noodl"] = _repo_noodl_search(query, repo_full, clone_url)
+    try:
+        # TaskGroup cancels the remaining lookups (and any clone) if one fails
+        async with asyncio.TaskGroup() as tg:
+            tasks = {key: tg.create_task(search) for key, search in searches.items()}
+    except ExceptionGroup as group:
+        raise group.exceptions[0] from None  # Surface the failure itself, as before
+    found = {key: task.result() for key, task in tasks.items()}
 
     sections: list[str] = []
 
-    exa_results = await _exa_code_search(query, repo_full)
-    exa_section = _format_results_section("Exa Code Context", exa_results)
+    exa_section = _format_results_section("Exa Code Context", found["exa"])
     if exa_section:
         sections.append(exa_section)
 
-    if repo_full:
-        deepwiki_answer = await _deepwiki_search(query, repo_full)
-        if deepwiki_answer:
-            sections.append(f"## DeepWiki\n{deepwiki_answer}")
+    deepwiki_answer = found.get("deepwiki")
+    if deepwiki_answer:
+        sections.append(f"## DeepWiki\n{deepwiki_answer}")
 
-    grep_results = await _grep_app_search(query, repo_full)
-    grep_section = _format_results_section("grep.app", grep_results)
+    grep_section = _format_results_section("grep.app", found["grep"])
     if grep_section:
         sections.append(grep_section)
 
-    if repo_path:
-        noodl_results = await asyncio.to_thread(_noodl_search, query, repo_path)
-        noodl_section = _format_results_section("Noodl", noodl_results)
-        if noodl_section:
-            sections.append(noodl_section)
+    noodl_section = _format_results_section("Noodl", found.get("noodl", []))
+    if noodl_section:
+        sections.append(noodl_section)
 
     if not sections:
         return "No results found."
@@ -3,12 +3,19 @@
 from __future__ import annotations
 
 from enum import Enum
+from functools import partial
 
 from pydantic import BaseModel, ConfigDict, Field
 
+from captain_search.cache import SingleFlight, TTLCache
 from captain_search.config import get_config
 from captain_search.providers.jina import JinaProvider
 
+# Successful fetches, keyed by (URL, format). The URL is used as given: fragments
+# and trailing slashes can select different content (e.g. hash-routed pages).
+_FETCH_CACHE = TTLCache(maxsize=256)
+_IN_FLIGHT = SingleFlight()
+
 
 class FetchFormat(str, Enum):
     """Output format options for fetch."""
@@ -56,9 +63,15 @@ async def fetch_webpage(
     api_key = jina_config.api_key if jina_config.enabled else None
 
     provider = JinaProvider(api_key=api_key, timeout=60.0)
+    cache_key = (url.strip(), format)
 
     try:
-        response = await provider.fetch(url, format=format)
+        response = _FETCH_CACHE.get(cache_key)
+        if response is None:
+            # Concurrent fetches of the same page share one upstream request
+            response = await _IN_FLIGHT.run(cache_key, partial(provider.fetch, url, format=format))
+            if not response.error:
+                _FETCH_CACHE.set(cache_key, response, config.settings.fetch_cache_ttl_seconds)
 
         if response.error:
             return f"**Error:** {response.error}"
@@ -0,0 +1,23 @@
+"""Shared markdown formatting for tool output."""
+
+from __future__ import annotations
+
+from captain_search.providers.base import SearchResult
+
+CONTENT_PREVIEW_CHARS = 500
+
+
+def append_result_markdown(lines: list[str], heading: str, result: SearchResult) -> None:
+    """Append one result's heading, URL and content preview to a markdown line buffer."""
+    lines.append(heading)
+    lines.append(f"**URL:** {result.url}")
+    if not result.content:
+        lines.append("")
+        return
+
+    # Slice one character past the limit so the length check doesn't rescan the content
+    preview = result.content[: CONTENT_PREVIEW_CHARS + 1]
+    if len(preview) > CONTENT_PREVIEW_CHARS:
+        lines.append(f"\n{preview[:CONTENT_PREVIEW_CHARS]}...\n")
+    else:
+        lines.append(f"\n{preview}\n")
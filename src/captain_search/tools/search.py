@@ -3,15 +3,22 @@
 from __future__ import annotations
 
 import asyncio
-import json
+import itertools
 import random
 import time
+import weakref
+from collections.abc import Callable
 from enum import Enum
+from functools import lru_cache, partial
+from typing import NamedTuple
 
 import httpx
+import orjson
 from pydantic import BaseModel, ConfigDict, Field
 
-from captain_search.config import Config, get_config
+from captain_search.cache import SingleFlight, TTLCache, canonical_url, normalize_query
+from captain_search.config import ProviderConfig, get_config
+from captain_search.limiter import AdaptiveLimiter
 from captain_search.providers import (
     BraveProvider,
     ExaMcpProvider,
@@ -23,6 +30,59 @@ from captain_search.providers import (
     TavilyProvider,
 )
 from captain_search.providers.base import SearchResponse
+from captain_search.tools.formatting import append_result_markdown
+
+ProviderFactory = Callable[[ProviderConfig, float], SearchProvider | None]
+
+# Build a provider from its config and timeout, or None if required keys are missing
+_PROVIDER_FACTORIES: dict[str, ProviderFactory] = {
+    "serper": lambda c, timeout: (
+        SerperProvider(api_key=c.api_key, timeout=timeout) if c.api_key else None
+    ),
+    "brave": lambda c, timeout: (
+        BraveProvider(api_key=c.api_key, timeout=timeout) if c.api_key else None
+    ),
+    "tavily": lambda c, timeout: (
+        TavilyProvider(api_key=c.api_key, api_keys=list(c.api_keys), timeout=timeout)
+        if c.api_key or c.api_keys
+        else None
+    ),
+    "perplexity": lambda c, timeout: (
+        PerplexityProvider(api_key=c.api_key, timeout=timeout) if c.api_key else None
+    ),
+    # Exa API provider requires API key
+    "exa": lambda c, timeout: (
+        ExaProvider(api_key=c.api_key, api_keys=list(c.api_keys), timeout=timeout)
+        if c.api_key or c.api_keys
+        else None
+    ),
+    # Exa MCP provider works without API key (free endpoint)
+    "exa_mcp": lambda c, timeout: ExaMcpProvider(timeout=timeout),
+}
+
+KNOWN_PROVIDERS = frozenset(_PROVIDER_FACTORIES)
+_AUTO_SELECTORS = frozenset({"", "auto"})
+_MULTI_SELECTORS = frozenset({"multi", "all"})
+
+# Provider instances, keyed by (name, api_key, api_keys, timeout) so config changes rebuild them
+_PROVIDER_CACHE: dict[tuple, SearchProvider] = {}
+
+# Upstream responses that mean "slow down"
+_OVERLOAD_STATUSES = frozenset({429, 503})
+
+# Providers that reject their credentials are skipped by auto-mode fallback for a
+# cooldown period. A 401 starts it at once; a 403 can also be a transient WAF or
+# rate-limit page, so it only counts once it repeats without a success in between.
+# Keyed by provider instance, so changing a provider's keys clears its cooldown.
+_FORBIDDEN_STRIKES_FOR_COOLDOWN = 2
+_AUTH_COOLDOWNS: weakref.WeakKeyDictionary[SearchProvider, tuple[float, str]] = (
+    weakref.WeakKeyDictionary()
+)
+_FORBIDDEN_STRIKES: weakref.WeakKeyDictionary[SearchProvider, int] = weakref.WeakKeyDictionary()
+
+# Per-provider search results, keyed by (provider, normalized query, max_results)
+_RESULT_CACHE = TTLCache(maxsize=512)
+_IN_FLIGHT = SingleFlight()
 
 
 class ResponseFormat(str, Enum):
@@ -46,32 +106,119 @@ class SearchInput(BaseModel):
     )
 
 
-def _get_provider_instance(name: str, config: Config) -> SearchProvider | None:
-    """Create a provider instance from config."""
-    provider_config = getattr(config.providers, name, None)
+class ProviderSelection(NamedTuple):
+    """A parsed provider selector."""
+
+    mode: str  # "auto", "multi", or "explicit"
+    requested: tuple[str, ...] = ()
+    unknown: tuple[str, ...] = ()
+
+
+@lru_cache(maxsize=128)
+def resolve_providers(selector: str | None) -> ProviderSelection:
+    """Parse a provider selector ("auto", "multi"/"all", a name, or a comma list)."""
+    value = (selector or "auto").strip().lower()
+    if value in _AUTO_SELECTORS:
+        return ProviderSelection("auto")
+    if value in _MULTI_SELECTORS:
+        return ProviderSelection("multi")
+
+    # dict.fromkeys de-duplicates while keeping the caller's order
+    names = dict.fromkeys(name for raw in value.split(",") if (name := raw.strip()))
+    if not names:
+        return ProviderSelection("auto")
+    return ProviderSelection(
+        "explicit",
+        requested=tuple(name for name in names if name in KNOWN_PROVIDERS),
+        unknown=tuple(name for name in names if name not in KNOWN_PROVIDERS),
+    )
+
+
+def _get_provider_instance(
+    name: str, provider_config: ProviderConfig | None, timeout: float
+) -> SearchProvider | None:
+    """Create a provider instance from its config."""
+    factory = _PROVIDER_FACTORIES.get(name)
+    if not provider_config or not provider_config.enabled or factory is None:
+        return None
+    return factory(provider_config, timeout)
+
+
+def _get_or_create_provider(
+    name: str, provider_config: ProviderConfig | None, timeout: float
+) -> SearchProvider | None:
+    """Get a reusable provider instance, creating it on first use.
+
+    Providers share the pooled HTTP client, so instances hold no connections of
+    their own and can be kept for the life of the process.
+    """
     if not provider_config or not provider_config.enabled:
         return None
 
-    api_key = provider_config.api_key
-    api_keys = provider_config.api_keys
-    timeout = config.settings.search_timeout_seconds
+    key = (name, provider_config.api_key, tuple(provider_config.api_keys), timeout)
+    provider = _PROVIDER_CACHE.get(key)
+    if provider is None:
+        provider = _get_provider_instance(name, provider_config, timeout)
+        if provider is not None:
+            _PROVIDER_CACHE[key] = provider
+    return provider
+
+
+def _auth_cooldown_error(provider: SearchProvider) -> str | None:
+    """Get the auth error a provider is cooling down from, if any."""
+    entry = _AUTH_COOLDOWNS.get(provider)
+    if entry is None:
+        return None
+    until, error = entry
+    if until <= time.monotonic():
+        del _AUTH_COOLDOWNS[provider]
+        return None
+    return error
+
+
+def _record_http_error(
+    provider: SearchProvider, name: str, e: httpx.HTTPStatusError, cooldown: float
+) -> str:
+    """Build the error message for a failed call, starting a cooldown on auth failures."""
+    error = _handle_api_error(e, name)
+    status = e.response.status_code
+    if status == 403:
+        strikes = _FORBIDDEN_STRIKES.get(provider, 0) + 1
+        if strikes < _FORBIDDEN_STRIKES_FOR_COOLDOWN:
+            _FORBIDDEN_STRIKES[provider] = strikes
+            return error
+    elif status != 401:
+        return error
+
+    _FORBIDDEN_STRIKES.pop(provider, None)
+    if cooldown > 0:
+        _AUTH_COOLDOWNS[provider] = (time.monotonic() + cooldown, error)
+    return error
+
+
+def _record_success(provider: SearchProvider) -> None:
+    """Forget earlier 403s once a provider answers successfully."""
+    _FORBIDDEN_STRIKES.pop(provider, None)
+
+
+@lru_cache(maxsize=4)
+def _get_limiter(min_limit: int, max_limit: int) -> AdaptiveLimiter:
+    """Get the process-wide provider call limiter for the configured bounds."""
+    return AdaptiveLimiter(min_limit=min_limit, max_limit=max_limit)
+
 
-    if name == "serper" and api_key:
-        return SerperProvider(api_key=api_key, timeout=timeout)
-    elif name == "brave" and api_key:
-        return BraveProvider(api_key=api_key, timeout=timeout)
-    elif name == "tavily" and (api_key or api_keys):
-        return TavilyProvider(api_key=api_key, api_keys=api_keys, timeout=timeout)
-    elif name == "perplexity" and api_key:
-        return PerplexityProvider(api_key=api_key, timeout=timeout)
-    elif name == "exa" and (api_key or api_keys):
-        # Exa API provider requires API key
-        return ExaProvider(api_key=api_key, api_keys=api_keys, timeout=timeout)
-    elif name == "exa_mcp":
-        # Exa MCP provider works without API key (free endpoint)
-        return ExaMcpProvider(timeout=timeout)
+def _cache_key(provider: str, query: str, max_results: int) -> tuple[str, str, int]:
+    """Build a result-cache key so trivial query variants share an entry."""
+    return provider, normalize_query(query), max_results
 
-    return None
+
+@lru_cache(maxsize=16)
+def _cumulative_weights(
+    weights: tuple[tuple[str, int], ...],
+) -> tuple[tuple[str, ...], tuple[int, ...]]:
+    """Split (name, weight) pairs into names and their running weight totals."""
+    names = tuple(name for name, _ in weights)
+    return names, tuple(itertools.accumulate(weight for _, weight in weights))
 
 
 def _weighted_random_choice(weights: dict[str, int]) -> str:
@@ -79,20 +226,11 @@ def _weighted_random_choice(weights: dict[str, int]) -> str:
     if not weights:
         raise ValueError("No providers available")
 
-    total = sum(weights.values())
-    if total == 0:
+    names, cum_weights = _cumulative_weights(tuple(weights.items()))
+    if cum_weights[-1] == 0:
         # Equal weights if all are 0
-        return random.choice(list(weights.keys()))
-
-    r = random.uniform(0, total)
-    cumulative = 0
-    for name, weight in weights.items():
-        cumulative += weight
-        if r <= cumulative:
-            return name
-
-    # Fallback to last provider
-    return list(weights.keys())[-1]
+        return random.choice(names)
+    return random.choices(names, cum_weights=cum_weights)[0]
 
 
 def _format_results_markdown(response: SearchResponse) -> str:
@@ -103,16 +241,9 @@ def _format_results_markdown(response: SearchResponse) -> str:
     if not response.results:
         return "No results found."
 
-    lines = []
+    lines: list[str] = []
     for i, result in enumerate(response.results, 1):
-        lines.append(f"## {i}. {result.title}")
-        lines.append(f"**URL:** {result.url}")
-        if result.content:
-            # Truncate long content
-            content = result.content[:500] + "..." if len(result.content) > 500 else result.content
-            lines.append(f"\n{content}\n")
-        else:
-            lines.append("")
+        append_result_markdown(lines, f"## {i}. {result.title}", result)
 
     return "\n".join(lines)
 
@@ -133,14 +264,17 @@ def _format_results_json(response: SearchResponse) -> str:
     # Only include error if present
     if response.error:
         output["error"] = response.error
-    return json.dumps(output, indent=2)
+    # Compact output: it is parsed by agents, so indentation only costs tokens
+    return orjson.dumps(output).decode()
 
 
 async def search_web(
     query: str,
     max_results: int = 10,
     format: str = "markdown",
-    provider: str | None = None,
+    provider: str | ProviderSelection | None = None,
+    bypass_cache: bool = False,
+    fast: bool = False,
 ) -> str:
     """
     Search the web using weighted random provider selection with automatic fallback.
@@ -154,24 +288,35 @@ async def search_web(
         max_results: Maximum number of results (1-50, default 10)
         format: Response format - "markdown" or "json" (default "markdown")
         provider: Provider selector - "auto" (default), "multi"/"all", provider name,
-            or comma-separated provider list
+            or comma-separated provider list (or a pre-parsed ProviderSelection)
+        bypass_cache: Skip cached results and query providers directly
+        fast: In multi/explicit mode, return once max_results unique results are in
+            and cancel the slower providers
 
     Returns:
         Search results in the specified format
     """
     start_time = time.monotonic()
     fmt = (format or "markdown").strip().lower()
-    provider_value = (provider or "auto").strip().lower()
+    selection = provider if isinstance(provider, ProviderSelection) else resolve_providers(provider)
+    # Bind config values once per request rather than per provider
     config = get_config()
-
-    known_providers = {"serper", "brave", "tavily", "perplexity", "exa", "exa_mcp"}
+    providers_config = config.providers
+    timeout = config.settings.search_timeout_seconds
+    cache_ttl = config.settings.search_cache_ttl_seconds
+    auth_cooldown = config.settings.auth_cooldown_seconds
+    limiter = _get_limiter(
+        config.settings.search_concurrency_min, config.settings.search_concurrency_max
+    )
 
     async def run_explicit_providers(
-        requested: list[str], unknown: list[str]
+        requested: list[str] | tuple[str, ...], unknown: tuple[str, ...]
     ) -> str:
         provider_instances: list[tuple[str, SearchProvider]] = []
         for name in requested:
-            instance = _get_provider_instance(name, config)
+            instance = _get_or_create_provider(
+                name, getattr(providers_config, name, None), timeout
+            )
             if instance is not None:
                 provider_instances.append((name, instance))
 
@@ -192,47 +337,62 @@ async def search_web(
         async def search_provider(
             name: str, provider_instance: SearchProvider
         ) -> tuple[str, list[SearchResult], str | None]:
+            cache_key = _cache_key(name, query, max_results)
+            if not bypass_cache and (cached := _RESULT_CACHE.get(cache_key)) is not None:
+                return name, cached, None
+            # Explicit and multi modes always call the provider; the auth cooldown
+            # only applies to auto-mode fallback
+
+            async def fetch_results() -> list[SearchResult]:
+                try:
+                    async with limiter.slot():
+                        # Bound each provider's time so a slow one can't stall the fan-out
+                        results = await asyncio.wait_for(
+                            provider_instance.search(query, max_results),
+                            timeout=timeout,
+                        )
+                except httpx.HTTPStatusError as e:
+                    limiter.record(overloaded=e.response.status_code in _OVERLOAD_STATUSES)
+                    raise
+                limiter.record(overloaded=False)
+                _RESULT_CACHE.set(cache_key, results, cache_ttl)
+                return results
+
             try:
-                results = await provider_instance.search(query, max_results)
+                # Identical searches already in flight share one upstream call
+                results = await _IN_FLIGHT.run(cache_key, fetch_results)
+                _record_success(provider_instance)
                 return name, results, None
             except httpx.HTTPStatusError as e:
-                return name, [], _handle_api_error(e, name)
-            except httpx.TimeoutException:
+                return name, [], _record_http_error(provider_instance, name, e, auth_cooldown)
+            except (httpx.TimeoutException, TimeoutError):
                 return name, [], f"{name}: Request timed out"
             except Exception as e:
                 detail = str(e).strip()
                 if detail:
                     return name, [], f"{name}: {type(e).__name__}: {detail}"
                 return name, [], f"{name}: {type(e).__name__}"
-            finally:
-                await provider_instance.close()
 
         tasks = [
-            search_provider(name, provider_instance)
+            asyncio.ensure_future(search_provider(name, provider_instance))
             for name, provider_instance in provider_instances
         ]
-        results_by_provider = await asyncio.gather(*tasks)
-
-        all_results: list[SearchResult] = []
-        providers_used: list[str] = []
-        errors: list[str] = []
-
-        for name, results, error in results_by_provider:
-            if results:
-                all_results.extend(results)
-                providers_used.append(name)
-            if error:
-                errors.append(error)
-
-        # Deduplicate by URL
-        if all_results:
-            seen_urls: set[str] = set()
-            unique_results: list[SearchResult] = []
-            for result in all_results:
-                if result.url and result.url not in seen_urls:
-                    seen_urls.add(result.url)
-                    unique_results.append(result)
-            all_results = unique_results
+        if fast:
+            results_by_provider = await _first_results(tasks, max_results)
+        else:
+            results_by_provider = await asyncio.gather(*tasks)
+
+        providers_used = [name for name, results, _ in results_by_provider if results]
+        errors = [error for _, _, error in results_by_provider if error]
+
+        # Deduplicate by canonical URL; dicts keep first-seen order
+        unique_results: dict[str, SearchResult] = {}
+        for result in itertools.chain.from_iterable(
+            results for _, results, _ in results_by_provider
+        ):
+            if result.url:
+                unique_results.setdefault(canonical_url(result.url), result)
+        all_results = list(unique_results.values())
 
         elapsed_ms = int((time.monotonic() - start_time) * 1000)
 
@@ -257,27 +417,14 @@ async def search_web(
         )
 
     # Explicit provider modes
-    if provider_value in {"multi", "all"}:
+    if selection.mode == "multi":
         requested = config.get_enabled_providers()
-        return await run_explicit_providers(requested=requested, unknown=[])
+        return await run_explicit_providers(requested=requested, unknown=())
 
-    if provider_value not in {"", "auto"}:
-        raw_names = [name.strip().lower() for name in provider_value.split(",") if name.strip()]
-        if not raw_names:
-            provider_value = "auto"
-        else:
-            requested: list[str] = []
-            unknown: list[str] = []
-            seen: set[str] = set()
-            for name in raw_names:
-                if name in seen:
-                    continue
-                seen.add(name)
-                if name in known_providers:
-                    requested.append(name)
-                else:
-                    unknown.append(name)
-            return await run_explicit_providers(requested=requested, unknown=unknown)
+    if selection.mode == "explicit":
+        return await run_explicit_providers(
+            requested=selection.requested, unknown=selection.unknown
+        )
 
     # Auto mode: weighted single-provider selection with fallback
 
@@ -307,18 +454,34 @@ async def search_web(
     last_error: str | None = None
 
     for provider_name in providers_to_try:
-        provider = _get_provider_instance(provider_name, config)
+        cache_key = _cache_key(provider_name, query, max_results)
+        if not bypass_cache and (cached := _RESULT_CACHE.get(cache_key)) is not None:
+            results = cached
+            providers_used.append(provider_name)
+            last_error = None
+            break
+
+        provider = _get_or_create_provider(
+            provider_name, getattr(providers_config, provider_name, None), timeout
+        )
         if not provider:
             continue
+        if cooldown_error := _auth_cooldown_error(provider):
+            last_error = cooldown_error
+            continue
 
         try:
-            results = await provider.search(query, max_results)
+            results = await _IN_FLIGHT.run(
+                cache_key, partial(provider.search, query, max_results)
+            )
+            _RESULT_CACHE.set(cache_key, results, cache_ttl)
+            _record_success(provider)
             providers_used.append(provider_name)
             last_error = None
             break  # Success!
 
         except httpx.HTTPStatusError as e:
-            last_error = _handle_api_error(e, provider_name)
+            last_error = _record_http_error(provider, provider_name, e, auth_cooldown)
             continue
 
         except httpx.TimeoutException:
@@ -329,9 +492,6 @@ async def search_web(
             last_error = f"{provider_name}: {type(e).__name__}"
             continue
 
-        finally:
-            await provider.close()
-
     elapsed_ms = int((time.monotonic() - start_time) * 1000)
     if not providers_used and last_error is None:
         last_error = "All configured providers failed. Try again later."
@@ -346,9 +506,38 @@ async def search_web(
     return _format_results_markdown(response) if fmt == "markdown" else _format_results_json(response)
 
 
+async def _first_results(
+    tasks: list[asyncio.Future[tuple[str, list[SearchResult], str | None]]],
+    target: int,
+) -> list[tuple[str, list[SearchResult], str | None]]:
+    """Collect provider outcomes as they finish, stopping at `target` unique URLs.
+
+    Providers still running at that point are cancelled, along with their
+    upstream requests unless another search is waiting on the same one.
+    """
+    outcomes: list[tuple[str, list[SearchResult], str | None]] = []
+    seen: set[str] = set()
+    try:
+        for next_done in asyncio.as_completed(tasks):
+            outcome = await next_done
+            outcomes.append(outcome)
+            seen.update(canonical_url(result.url) for result in outcome[1] if result.url)
+            if len(seen) >= target:
+                break
+    finally:
+        for task in tasks:
+            task.cancel()
+    return outcomes
+
+
 def _handle_api_error(e: httpx.HTTPStatusError, provider: str) -> str:
     """Generate actionable error message for API errors."""
-    status = e.response.status_code
+    return _api_error_message(provider, e.response.status_code)
+
+
+@lru_cache(maxsize=128)
+def _api_error_message(provider: str, status: int) -> str:
+    """Build (once per provider and status) the message for an API error."""
     if status == 401:
         return f"{provider}: Invalid API key. Check your {provider.upper()}_API_KEY."
     elif status == 403:
@@ -0,0 +1,36 @@
+"""Shared fixtures for the test suite."""
+
+from __future__ import annotations
+
+from collections.abc import AsyncIterator
+
+import httpx
+import pytest
+import pytest_asyncio
+
+from captain_search.config import Config, get_config, reset_config
+from captain_search.providers.base import close_shared_client, get_shared_client
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def http_client() -> AsyncIterator[httpx.AsyncClient]:
+    """Pooled HTTP client kept open across the session's e2e tests.
+
+    Providers pick up the shared client of the running loop, so tests on the
+    session loop reuse its connections instead of reconnecting per test.
+    """
+    yield get_shared_client()
+    await close_shared_client()
+
+
+@pytest.fixture(scope="session")
+def config() -> Config:
+    """Configuration built once from the environment for the whole session."""
+    reset_config()
+    return get_config()
+
+
+@pytest.fixture(scope="session")
+def enabled_providers(config: Config) -> frozenset[str]:
+    """Names of the web search providers with credentials configured."""
+    return frozenset(config.get_enabled_providers())
@@ -0,0 +1,96 @@
+"""Tests for the static bearer token auth used by remote deployments."""
+
+from __future__ import annotations
+
+import pytest
+from starlette.requests import HTTPConnection
+
+from captain_search.auth import BearerOrQueryAuthBackend, StaticBearerTokenAuth, build_auth_provider
+
+
+def _connection(authorization: str | None = None, query: str = "") -> HTTPConnection:
+    headers = []
+    if authorization is not None:
+        headers.append((b"authorization", authorization.encode()))
+    return HTTPConnection({"type": "http", "headers": headers, "query_string": query.encode()})
+
+
+async def _authenticated_token(
+    verifier: StaticBearerTokenAuth, authorization: str | None = None, query: str = ""
+) -> str | None:
+    backend = BearerOrQueryAuthBackend(verifier)
+    result = await backend.authenticate(_connection(authorization, query))
+    if result is None:
+        return None
+    _, user = result
+    return user.access_token.token
+
+
+async def test_verify_token_accepts_only_configured_tokens() -> None:
+    verifier = StaticBearerTokenAuth(["secret"])
+
+    assert await verifier.verify_token("secret")
+    assert await verifier.verify_token("wrong") is None
+    assert await verifier.verify_token("secre") is None
+    assert await verifier.verify_token("") is None
+
+
+async def test_verify_token_accepts_every_rotation_token() -> None:
+    verifier = build_auth_provider(" old , new ,")
+    assert isinstance(verifier, StaticBearerTokenAuth)
+
+    assert await verifier.verify_token("old")
+    assert await verifier.verify_token("new")
+    assert await verifier.verify_token("old,new") is None
+
+
+async def test_verify_token_handles_non_ascii() -> None:
+    verifier = StaticBearerTokenAuth(["sécret"])
+
+    assert await verifier.verify_token("sécret")
+    assert await verifier.verify_token("secret") is None
+    assert await StaticBearerTokenAuth(["secret"]).verify_token("sécret") is None
+
+
+def test_blank_token_config_disables_auth() -> None:
+    assert build_auth_provider(None) is None
+    assert build_auth_provider("  ") is None
+    with pytest.raises(ValueError):
+        StaticBearerTokenAuth([" "])
+
+
+@pytest.mark.parametrize("scheme", ["Bearer", "bearer", "BEARER"])
+async def test_bearer_scheme_is_case_insensitive(scheme: str) -> None:
+    verifier = StaticBearerTokenAuth(["secret"])
+    assert await _authenticated_token(verifier, f"{scheme} secret") == "secret"
+
+
+async def test_bearer_rejects_other_schemes_and_bad_tokens() -> None:
+    verifier = StaticBearerTokenAuth(["secret"])
+
+    assert await _authenticated_token(verifier, "Basic secret") is None
+    assert await _authenticated_token(verifier, "Bearer wrong") is None
+    assert await _authenticated_token(verifier) is None
+
+
+@pytest.mark.parametrize(
+    ("query", "expected"),
+    [
+        ("token=secret", "secret"),
+        # api_key outranks token wherever it appears
+        ("token=other&api_key=secret", "secret"),
+        # The last duplicate of a name is used
+        ("api_key=other&api_key=secret", "secret"),
+        # An empty value falls through to the next name
+        ("api_key=&token=secret", "secret"),
+        ("api_key=wrong&token=secret", None),
+    ],
+)
+async def test_query_param_fallback_precedence(query: str, expected: str | None) -> None:
+    verifier = StaticBearerTokenAuth(["secret", "other"])
+    assert await _authenticated_token(verifier, query=query) == expected
+
+
+async def test_bearer_header_takes_precedence_over_query() -> None:
+    verifier = StaticBearerTokenAuth(["secret", "other"])
+    assert await _authenticated_token(verifier, "Bearer secret", "api_key=other") == "secret"
@@ -2,12 +2,24 @@
 
 from __future__ import annotations
 
-import asyncio
-import json
 import os
+import re
 
+import orjson
 import pytest
 
+# Imported at module scope so import failures surface once, at collection
+from captain_search import __version__
+from captain_search.config import Config, get_config  # noqa: F401
+from captain_search.providers import (
+    BraveProvider,
+    JinaProvider,  # noqa: F401
+    PerplexityProvider,  # noqa: F401
+    SearchProvider,  # noqa: F401
+    SearchResult,
+    SerperProvider,  # noqa: F401
+    TavilyProvider,  # noqa: F401
+)
 from captain_search.tools import fetch_webpage, search_code, search_web
 
 QUERY = "openai api"
@@ -15,62 +27,86 @@ FETCH_URL = "https://example.com"
 CODE_QUERY = "contextmanager"
 NO_PROVIDERS_ERROR = "No search providers configured"
 AUTH_ERROR_MARKERS = ["Invalid API key", "Access forbidden", "HTTP 401", "HTTP 403"]
+AUTH_ERROR_RE = re.compile("|".join(map(re.escape, AUTH_ERROR_MARKERS)))
 
 
 def test_imports():
     """Test that all modules can be imported."""
-    from captain_search import __version__
-    from captain_search.config import Config, get_config  # noqa: F401
-    from captain_search.providers import (
-        BraveProvider,  # noqa: F401
-        JinaProvider,  # noqa: F401
-        PerplexityProvider,  # noqa: F401
-        SearchProvider,  # noqa: F401
-        SearchResult,  # noqa: F401
-        SerperProvider,  # noqa: F401
-        TavilyProvider,  # noqa: F401
-    )
-    from captain_search.tools import fetch_webpage, search_code, search_web  # noqa: F401
-
     assert isinstance(__version__, str)
     assert __version__
 
 
+def test_search_result_model():
+    """SearchResult keeps the pydantic model API it is exported with."""
+    result = SearchResult(title="Example", url="https://example.com", source="test", rank=1)
+
+    assert result.content == ""
+    assert result.model_dump() == {
+        "title": "Example",
+        "url": "https://example.com",
+        "content": "",
+        "source": "test",
+    }
+    assert SearchResult.model_validate_json(result.model_dump_json()) == result
+
+
+def test_normalize_results_skips_malformed_rows():
+    """One malformed row from a provider doesn't fail the whole result list."""
+    provider = BraveProvider(api_key="test")
+    raw = [
+        None,
+        "row",
+        {"title": "No URL"},
+        {"url": "https://example.com", "title": None},
+        {"url": "https://example.org", "title": "Example", "description": "Snippet"},
+    ]
+
+    assert provider._normalize_results(raw) == [
+        SearchResult(title="Example", url="https://example.org", content="Snippet", source="brave")
+    ]
+
+
 def _skip_if_no_e2e() -> None:
     if not os.getenv("RUN_E2E"):
         pytest.skip("Set RUN_E2E=1 to run networked smoke tests")
 
 
-def test_search_web_smoke() -> None:
+@pytest.mark.asyncio(loop_scope="session")
+@pytest.mark.usefixtures("http_client")
+async def test_search_web_smoke() -> None:
     _skip_if_no_e2e()
 
-    output = asyncio.run(search_web(query=QUERY, max_results=1, format="json"))
+    output = await search_web(query=QUERY, max_results=1, format="json", bypass_cache=True)
     try:
-        payload = json.loads(output)
-    except json.JSONDecodeError as e:
+        payload = orjson.loads(output)
+    except orjson.JSONDecodeError as e:
         pytest.fail(f"search_web returned non-JSON output: {output[:200]} ({e})")
     error = payload.get("error")
 
     if error and NO_PROVIDERS_ERROR in error:
         pytest.skip("No web providers configured")
-    if error and any(marker in error for marker in AUTH_ERROR_MARKERS):
+    if error and AUTH_ERROR_RE.search(error):
         pytest.skip("Web provider authentication not configured")
 
     assert not error, f"search_web error: {error}"
     assert payload["results"], "No search results returned"
 
 
-def test_fetch_webpage_smoke() -> None:
+@pytest.mark.asyncio(loop_scope="session")
+@pytest.mark.usefixtures("http_client")
+async def test_fetch_webpage_smoke() -> None:
     _skip_if_no_e2e()
 
-    output = asyncio.run(fetch_webpage(url=FETCH_URL, format="markdown"))
+    output = await fetch_webpage(url=FETCH_URL, format="markdown")
     assert not output.startswith("**Error:**")
     assert "Example Domain" in output
 
 
-def test_search_code_smoke() -> None:
+@pytest.mark.asyncio(loop_scope="session")
+@pytest.mark.usefixtures("http_client")
+async def test_search_code_smoke() -> None:
     _skip_if_no_e2e()
 
-    output = asyncio.run(search_code(query=CODE_QUERY))
+    output = await search_code(query=CODE_QUERY)
     assert output.strip()
     assert output.strip() != "No results found."
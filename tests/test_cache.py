@@ -0,0 +1,143 @@
+"""Tests for the in-process caching helpers."""
+
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from captain_search import cache
+from captain_search.cache import SingleFlight, TTLCache, canonical_url
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def monotonic(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch: pytest.MonkeyPatch) -> FakeClock:
+    fake = FakeClock()
+    monkeypatch.setattr(cache, "time", fake)
+    return fake
+
+
+def test_ttl_cache_expires_entries(clock: FakeClock) -> None:
+    ttl_cache = TTLCache()
+    ttl_cache.set("key", "value", ttl=10)
+
+    clock.now = 9.9
+    assert ttl_cache.get("key") == "value"
+    clock.now = 10.0
+    assert ttl_cache.get("key") is None
+    assert len(ttl_cache) == 0
+
+
+def test_ttl_cache_non_positive_ttl_stores_nothing(clock: FakeClock) -> None:
+    ttl_cache = TTLCache()
+    ttl_cache.set("key", "value", ttl=0)
+    assert ttl_cache.get("key") is None
+
+
+def test_ttl_cache_evicts_least_recently_used(clock: FakeClock) -> None:
+    ttl_cache = TTLCache(maxsize=2)
+    ttl_cache.set("a", 1, ttl=60)
+    ttl_cache.set("b", 2, ttl=60)
+    assert ttl_cache.get("a") == 1  # "b" is now the least recently used
+    ttl_cache.set("c", 3, ttl=60)
+
+    assert ttl_cache.get("b") is None
+    assert ttl_cache.get("a") == 1
+    assert ttl_cache.get("c") == 3
+
+
+async def test_single_flight_shares_one_call() -> None:
+    flight = SingleFlight()
+    calls = 0
+    release = asyncio.Event()
+
+    async def work() -> str:
+        nonlocal calls
+        calls += 1
+        await release.wait()
+        return "done"
+
+    waiters = [asyncio.ensure_future(flight.run("key", work)) for _ in range(3)]
+    await asyncio.sleep(0)
+    release.set()
+
+    assert await asyncio.gather(*waiters) == ["done"] * 3
+    assert calls == 1
+    assert not flight._tasks
+    assert not flight._waiters
+
+
+async def test_single_flight_shares_exception() -> None:
+    flight = SingleFlight()
+    release = asyncio.Event()
+
+    async def work() -> str:
+        await release.wait()
+        raise ValueError("boom")
+
+    waiters = [asyncio.ensure_future(flight.run("key", work)) for _ in range(2)]
+    await asyncio.sleep(0)
+    release.set()
+
+    outcomes = await asyncio.gather(*waiters, return_exceptions=True)
+    assert all(isinstance(outcome, ValueError) for outcome in outcomes)
+    assert not flight._tasks
+
+    # A finished call isn't reused; the next caller starts fresh
+    async def ok() -> str:
+        return "ok"
+
+    assert await flight.run("key", ok) == "ok"
+
+
+async def test_single_flight_cancels_work_after_last_waiter() -> None:
+    flight = SingleFlight()
+    started = asyncio.Event()
+    cancelled = asyncio.Event()
+
+    async def work() -> str:
+        started.set()
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            cancelled.set()
+            raise
+        return "done"
+
+    first = asyncio.ensure_future(flight.run("key", work))
+    second = asyncio.ensure_future(flight.run("key", work))
+    await started.wait()
+
+    # One waiter leaving doesn't stop work the other still needs
+    first.cancel()
+    await asyncio.sleep(0)
+    assert not cancelled.is_set()
+
+    second.cancel()
+    await asyncio.wait_for(cancelled.wait(), timeout=1.0)
+    assert not flight._tasks
+
+
+@pytest.mark.parametrize(
+    ("url", "expected"),
+    [
+        ("HTTPS://Example.COM:443/Path/", "https://example.com/Path"),
+        ("http://example.com:80", "http://example.com"),
+        ("http://example.com:8080/", "http://example.com:8080"),
+        ("https://example.com/page#section", "https://example.com/page"),
+        ("https://example.com/?utm_source=x&id=1&gclid=y", "https://example.com?id=1"),
+        ("https://example.com/?b=2&a=1", "https://example.com?b=2&a=1"),
+        ("https://example.com:bad/", "https://example.com:bad"),
+        (" http://[bad ", "http://[bad"),
+    ],
+)
+def test_canonical_url(url: str, expected: str) -> None:
+    assert canonical_url(url) == expected
@@ -0,0 +1,98 @@
+"""Tests for the adaptive concurrency limiter."""
+
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from captain_search.limiter import AdaptiveLimiter
+
+
+def test_overload_halves_limit_down_to_minimum() -> None:
+    limiter = AdaptiveLimiter(min_limit=2, max_limit=8)
+    assert limiter.limit == 8
+
+    limiter.record(overloaded=True)
+    assert limiter.limit == 4
+    limiter.record(overloaded=True)
+    assert limiter.limit == 2
+    limiter.record(overloaded=True)
+    assert limiter.limit == 2
+
+
+def test_success_window_grows_limit_up_to_maximum() -> None:
+    limiter = AdaptiveLimiter(min_limit=1, max_limit=3)
+    limiter.record(overloaded=True)
+    assert limiter.limit == 1
+
+    limiter.record(overloaded=False)  # A window of 1 success at limit 1
+    assert limiter.limit == 2
+    limiter.record(overloaded=False)
+    assert limiter.limit == 2
+    limiter.record(overloaded=False)  # Window of 2 at limit 2
+    assert limiter.limit == 3
+
+    for _ in range(10):
+        limiter.record(overloaded=False)
+    assert limiter.limit == 3
+
+
+def test_overload_resets_success_window() -> None:
+    limiter = AdaptiveLimiter(min_limit=1, max_limit=8)
+    limiter.record(overloaded=True)  # limit 4
+    for _ in range(3):
+        limiter.record(overloaded=False)
+    limiter.record(overloaded=True)  # limit 2, window restarts
+    limiter.record(overloaded=False)
+    assert limiter.limit == 2
+
+
+def test_limits_are_clamped() -> None:
+    limiter = AdaptiveLimiter(min_limit=0, max_limit=0)
+    assert (limiter.min_limit, limiter.max_limit, limiter.limit) == (1, 1, 1)
+
+
+async def test_slot_waits_for_free_slot() -> None:
+    limiter = AdaptiveLimiter(min_limit=1, max_limit=1)
+    acquired = asyncio.Event()
+
+    async def acquire() -> None:
+        async with limiter.slot():
+            acquired.set()
+
+    async with limiter.slot():
+        waiter = asyncio.ensure_future(acquire())
+        await asyncio.sleep(0)
+        assert not acquired.is_set()
+    await asyncio.wait_for(waiter, timeout=1.0)
+    assert acquired.is_set()
+    assert limiter._active == 0
+
+
+async def test_slot_released_on_exception() -> None:
+    limiter = AdaptiveLimiter(min_limit=1, max_limit=1)
+    with pytest.raises(ValueError):
+        async with limiter.slot():
+            raise ValueError("boom")
+    assert limiter._active == 0
+
+
+async def test_slot_released_on_cancellation() -> None:
+    limiter = AdaptiveLimiter(min_limit=1, max_limit=1)
+    entered = asyncio.Event()
+
+    async def hold() -> None:
+        async with limiter.slot():
+            entered.set()
+            await asyncio.sleep(10)
+
+    task = asyncio.ensure_future(hold())
+    await entered.wait()
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+
+    assert limiter._active == 0
+    async with asyncio.timeout(1.0), limiter.slot():
+        pass
@@ -3,19 +3,24 @@
 from __future__ import annotations
 
 import asyncio
-import json
+import itertools
 import os
+import re
 
+import httpx
+import orjson
 import pytest
+import pytest_asyncio
 
-from captain_search.config import get_config, reset_config
 from captain_search.providers import NoodlProvider
 from captain_search.tools import search_code, search_web
 
 QUERY = "openai api"
 MAX_RESULTS_PER_PROVIDER = 1
+PROVIDER_CHECK_TIMEOUT = 60.0
 PROVIDERS = ["serper", "brave", "tavily", "perplexity", "exa", "exa_mcp"]
 AUTH_ERROR_MARKERS = ["Invalid API key", "Access forbidden", "HTTP 401", "HTTP 403"]
+AUTH_ERROR_RE = re.compile("|".join(map(re.escape, AUTH_ERROR_MARKERS)))
 GLOBAL_CODE_QUERY = "contextmanager"
 REPO_CODE_QUERY = "search_web"
 CODE_REPO = "mnm-matin/captain-search"
@@ -25,16 +30,32 @@ CODE_SECTIONS = [
     ("deepwiki", "## DeepWiki"),
     ("noodl", "## Noodl"),
 ]
+# Code providers checked against the global (non repo-scoped) query
+GLOBAL_CODE_PROVIDERS = frozenset({"exa_mcp", "grep_app"})
+# (checked globally, section present) -> (status, details)
+CODE_STATUS_TABLE = {
+    (True, True): ("ok", "section present"),
+    (True, False): ("failed", "No results returned"),
+    (False, True): ("ok", "section present"),
+    (False, False): ("not_tested", "No results returned"),
+}
 
+MATRIX_HEADER = ("| Provider | Status | Details |", "|---|---|---|")
+_CELL_ESCAPES = str.maketrans({"|": "\\|"})
 
-async def _check_provider(provider: str, enabled_providers: set[str]) -> dict[str, str]:
+# Run on the session loop so the tests share one pooled HTTP client
+pytestmark = [pytest.mark.asyncio(loop_scope="session"), pytest.mark.usefixtures("http_client")]
+
+
+async def _check_provider(provider: str, enabled_providers: frozenset[str]) -> dict[str, str]:
     output = await search_web(
         query=QUERY,
         max_results=MAX_RESULTS_PER_PROVIDER,
         provider=provider,
         format="json",
+        bypass_cache=True,  # A health probe must reach the provider
     )
-    payload = json.loads(output)
+    payload = orjson.loads(output)
     error = payload.get("error")
     results = payload["results"]
 
@@ -45,7 +66,7 @@ async def _check_provider(provider: str, enabled_providers: set[str]) -> dict[st
             "details": "API key missing or provider disabled",
         }
     if error:
-        if any(marker in error for marker in AUTH_ERROR_MARKERS):
+        if AUTH_ERROR_RE.search(error):
             return {
                 "provider": provider,
                 "status": "not_tested",
@@ -61,12 +82,23 @@ async def _check_provider(provider: str, enabled_providers: set[str]) -> dict[st
     }
 
 
+async def _check_provider_bounded(
+    provider: str, enabled_providers: frozenset[str]
+) -> dict[str, str]:
+    try:
+        return await asyncio.wait_for(
+            _check_provider(provider, enabled_providers), timeout=PROVIDER_CHECK_TIMEOUT
+        )
+    except TimeoutError:
+        return {"provider": provider, "status": "failed", "details": "Timed out"}
+
+
 def _render_matrix(rows: list[dict[str, str]]) -> str:
-    lines = ["| Provider | Status | Details |", "|---|---|---|"]
-    for row in rows:
-        details = row["details"].replace("|", "\\|")
-        lines.append(f"| {row['provider']} | {row['status']} | {details} |")
-    return "\n".join(lines)
+    body = (
+        f"| {row['provider']} | {row['status']} | {row['details'].translate(_CELL_ESCAPES)} |"
+        for row in rows
+    )
+    return "\n".join(itertools.chain(MATRIX_HEADER, body))
 
 
 def _skip_if_no_e2e() -> None:
@@ -74,23 +106,25 @@ def _skip_if_no_e2e() -> None:
         pytest.skip("Set RUN_E2E=1 to run provider e2e tests")
 
 
-def test_web_providers_e2e_matrix() -> None:
+@pytest_asyncio.fixture(scope="module", loop_scope="session")
+async def web_matrix(
+    http_client: httpx.AsyncClient, enabled_providers: frozenset[str]
+) -> dict[str, dict[str, str]]:
+    """Probe every web provider concurrently, once, and print the matrix."""
     _skip_if_no_e2e()
-    reset_config()
-    enabled = set(get_config().get_enabled_providers())
-
-    async def run_checks() -> list[dict[str, str]]:
-        rows = []
-        for provider in PROVIDERS:
-            rows.append(await _check_provider(provider, enabled))
-        return rows
+    # gather keeps rows in PROVIDERS order
+    rows = await asyncio.gather(
+        *(_check_provider_bounded(provider, enabled_providers) for provider in PROVIDERS)
+    )
+    print("\n" + _render_matrix(rows))
+    return {row["provider"]: row for row in rows}
 
-    rows = asyncio.run(run_checks())
-    matrix = _render_matrix(rows)
-    print("\n" + matrix)
 
-    failures = [row for row in rows if row["status"] == "failed"]
-    assert not failures, f"Some providers failed:\n{matrix}"
+# Thin per-provider asserts over the shared probe, so failures are reported per provider
+@pytest.mark.parametrize("provider", PROVIDERS)
+async def test_web_provider_e2e(provider: str, web_matrix: dict[str, dict[str, str]]) -> None:
+    row = web_matrix[provider]
+    assert row["status"] != "failed", _render_matrix([row])
 
 
 def _check_code_providers(
@@ -100,7 +134,6 @@ def _check_code_providers(
 ) -> list[dict[str, str]]:
     rows = []
     for provider, section in CODE_SECTIONS:
-        output = output_global if provider in {"exa_mcp", "grep_app"} else output_repo
         if provider == "noodl" and not noodl_available:
             rows.append(
                 {
@@ -111,21 +144,35 @@ def _check_code_providers(
             )
             continue
 
-        if section in output:
-            rows.append({"provider": provider, "status": "ok", "details": "section present"})
-            continue
-
-        status = "failed" if provider in {"exa_mcp", "grep_app"} else "not_tested"
-        rows.append({"provider": provider, "status": status, "details": "No results returned"})
+        is_global = provider in GLOBAL_CODE_PROVIDERS
+        output = output_global if is_global else output_repo
+        status, details = CODE_STATUS_TABLE[is_global, section in output]
+        rows.append({"provider": provider, "status": status, "details": details})
 
     return rows
 
 
-def test_code_providers_e2e_matrix() -> None:
+async def _search_code_bounded(**kwargs: str) -> str:
+    # A timed-out search reports its sections as missing rather than hanging
+    try:
+        return await asyncio.wait_for(search_code(**kwargs), timeout=PROVIDER_CHECK_TIMEOUT)
+    except TimeoutError:
+        return ""
+
+
+@pytest.fixture(scope="session")
+def noodl_available() -> bool:
+    """Probe for the noodl CLI once per test session."""
+    return NoodlProvider().is_available()
+
+
+async def test_code_providers_e2e_matrix(noodl_available: bool) -> None:
     _skip_if_no_e2e()
-    output_global = asyncio.run(search_code(query=GLOBAL_CODE_QUERY))
-    output_repo = asyncio.run(search_code(query=REPO_CODE_QUERY, repo=CODE_REPO))
-    noodl_available = NoodlProvider().is_available()
+    # A failing search cancels its sibling instead of leaving it running
+    async with asyncio.TaskGroup() as tg:
+        global_task = tg.create_task(_search_code_bounded(query=GLOBAL_CODE_QUERY))
+        repo_task = tg.create_task(_search_code_bounded(query=REPO_CODE_QUERY, repo=CODE_REPO))
+    output_global, output_repo = global_task.result(), repo_task.result()
     rows = _check_code_providers(output_global, output_repo, noodl_available)
     matrix = _render_matrix(rows)
     print("\n" + matrix)
@@ -0,0 +1,106 @@
+"""Offline tests for search_web orchestration."""
+
+from __future__ import annotations
+
+import asyncio
+
+import httpx
+import orjson
+import pytest
+
+from captain_search.providers import SearchResult
+from captain_search.tools import search
+
+
+class FakeProvider:
+    """Returns `count` results after `delay` seconds and records cancellation."""
+
+    def __init__(self, name: str, delay: float, count: int):
+        self.name = name
+        self.delay = delay
+        self.count = count
+        self.cancelled = asyncio.Event()
+
+    async def search(self, query: str, max_results: int) -> list[SearchResult]:
+        try:
+            await asyncio.sleep(self.delay)
+        except asyncio.CancelledError:
+            self.cancelled.set()
+            raise
+        return [
+            SearchResult(
+                title=f"{self.name} {i}", url=f"https://{self.name}.test/{i}", source=self.name
+            )
+            for i in range(self.count)
+        ]
+
+
+@pytest.fixture
+def fake_providers(monkeypatch: pytest.MonkeyPatch) -> dict[str, FakeProvider]:
+    providers = {
+        "serper": FakeProvider("serper", delay=0.01, count=3),
+        "brave": FakeProvider("brave", delay=10.0, count=3),
+    }
+    monkeypatch.setattr(
+        search, "_get_or_create_provider", lambda name, config, timeout: providers.get(name)
+    )
+    return providers
+
+
+async def test_fast_mode_cancels_slow_provider(fake_providers: dict[str, FakeProvider]) -> None:
+    output = await search.search_web(
+        "query", max_results=3, format="json", provider="serper,brave", bypass_cache=True, fast=True
+    )
+    payload = orjson.loads(output)
+
+    assert [result["url"] for result in payload["results"]] == [
+        f"https://serper.test/{i}" for i in range(3)
+    ]
+    # Cancellation reaches the provider's coroutine, not just search_web's wrapper
+    await asyncio.wait_for(fake_providers["brave"].cancelled.wait(), timeout=1.0)
+
+
+def _status_error(status: int) -> httpx.HTTPStatusError:
+    request = httpx.Request("GET", "https://provider.test")
+    return httpx.HTTPStatusError(
+        "error", request=request, response=httpx.Response(status, request=request)
+    )
+
+
+def test_unauthorized_starts_cooldown() -> None:
+    provider = FakeProvider("serper", delay=0, count=0)
+    search._record_http_error(provider, "serper", _status_error(401), cooldown=60)
+    assert search._auth_cooldown_error(provider)
+
+
+def test_forbidden_starts_cooldown_only_when_repeated() -> None:
+    provider = FakeProvider("serper", delay=0, count=0)
+    search._record_http_error(provider, "serper", _status_error(403), cooldown=60)
+    assert search._auth_cooldown_error(provider) is None
+
+    # A success in between means the 403 was transient
+    search._record_success(provider)
+    search._record_http_error(provider, "serper", _status_error(403), cooldown=60)
+    assert search._auth_cooldown_error(provider) is None
+
+    search._record_http_error(provider, "serper", _status_error(403), cooldown=60)
+    assert search._auth_cooldown_error(provider)
+
+
+def test_zero_cooldown_disables_skipping() -> None:
+    provider = FakeProvider("serper", delay=0, count=0)
+    search._record_http_error(provider, "serper", _status_error(401), cooldown=0)
+    assert search._auth_cooldown_error(provider) is None
+
+
+async def test_explicit_provider_ignores_auth_cooldown(
+    fake_providers: dict[str, FakeProvider],
+) -> None:
+    serper = fake_providers["serper"]
+    search._record_http_error(serper, "serper", _status_error(401), cooldown=60)
+    assert search._auth_cooldown_error(serper)
+
+    output = await search.search_web(
+        "query", max_results=3, format="json", provider="serper", bypass_cache=True
+    )
+    assert len(orjson.loads(output)["results"]) == 3
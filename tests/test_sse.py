@@ -0,0 +1,59 @@
+"""Tests for the streamed SSE parser shared by the MCP providers."""
+
+from __future__ import annotations
+
+from collections.abc import AsyncIterator
+
+import httpx
+import pytest
+
+from captain_search.providers.base import iter_sse_data
+
+
+class ChunkStream(httpx.AsyncByteStream):
+    """Response body delivered in the given chunks, as a network read would."""
+
+    def __init__(self, chunks: tuple[bytes, ...]):
+        self.chunks = chunks
+
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        for chunk in self.chunks:
+            yield chunk
+
+
+async def _parse(*chunks: bytes) -> list[bytes]:
+    response = httpx.Response(200, stream=ChunkStream(chunks))
+    return [payload async for payload in iter_sse_data(response)]
+
+
+async def test_frames_split_across_chunks() -> None:
+    payloads = await _parse(b"event: message\nda", b'ta: {"a": ', b"1}\n\ndata: 2", b"\n")
+    assert payloads == [b'{"a": 1}', b"2"]
+
+
+async def test_crlf_line_endings() -> None:
+    payloads = await _parse(b"event: message\r\ndata: one\r\n\r\ndata: two\r", b"\n")
+    assert payloads == [b"one", b"two"]
+
+
+@pytest.mark.parametrize(
+    ("line", "payload"),
+    [
+        (b"data: value\n", b"value"),
+        (b"data:value\n", b"value"),
+        (b"data:  two spaces\n", b" two spaces"),
+        (b"data:\n", b""),
+    ],
+)
+async def test_data_prefix_space_is_optional(line: bytes, payload: bytes) -> None:
+    assert await _parse(line) == [payload]
+
+
+async def test_final_line_without_newline() -> None:
+    payloads = await _parse(b"data: first\n", b"data: last")
+    assert payloads == [b"first", b"last"]
+
+
+async def test_ignores_other_fields() -> None:
+    payloads = await _parse(b": comment\nevent: message\nid: 1\nretry: 10\ndata: x\n")
+    assert payloads == [b"x"]